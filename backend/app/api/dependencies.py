@@ -1,9 +1,19 @@
 """API dependencies."""
-from typing import Optional
-from fastapi import Depends, HTTPException, status
+import asyncio
+import hashlib
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from aiodataloader import DataLoader
+from cachetools import TLRUCache, TTLCache
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from prisma import Prisma
 from prisma.models import User
 
+from app.config import settings
 from app.db.prisma import get_prisma
 from app.utils.auth import decode_token
 from app.utils.errors import InvalidTokenError, UserNotFoundError
@@ -11,15 +21,220 @@ from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+_ACCESS_TOKEN_TYPE = sys.intern("access")
+_SUBJECT_CLAIM = sys.intern("sub")
+_TYPE_CLAIM = sys.intern("type")
+
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
+
+# Validated access-token payloads keyed by SHA-256 of the raw token. Each entry
+# expires at the token's own ``exp`` claim, so expired tokens are never served.
+_jwt_cache: TLRUCache = TLRUCache(
+    maxsize=10000,
+    ttu=lambda _key, payload, _now: payload["exp"],
+    timer=time.time
+)
+_jwt_cache_lock = threading.Lock()
+
+# Recently authenticated users keyed by user ID
+_user_cache: TTLCache = TTLCache(maxsize=5000, ttl=30)
+_user_cache_lock = threading.Lock()
+
+# Bounds concurrent user lookups below the Prisma pool size (leaving headroom
+# for route queries) so bursts fail fast instead of queueing inside Prisma.
+_user_query_semaphore = asyncio.Semaphore(
+    max(1, settings.DATABASE_CONNECTION_LIMIT - 2)
+)
+
+
+def _verify_cached(token: str) -> Optional[Dict[str, Any]]:
+    """Decode a JWT, reusing the payload of previously validated access tokens.
+
+    Args:
+        token: Raw JWT token string
+
+    Returns:
+        Decoded token payload or None if invalid
+    """
+    key = hashlib.sha256(token.encode()).hexdigest()
+    
+    with _jwt_cache_lock:
+        payload = _jwt_cache.get(key)
+    if payload is not None:
+        return payload
+    
+    payload = decode_token(token)
+
+    # Only cache successfully validated, unexpired access tokens
+    if (
+        payload is not None
+        and payload.get(_TYPE_CLAIM) == _ACCESS_TOKEN_TYPE
+        and isinstance(payload.get("exp"), (int, float))
+        and payload["exp"] > time.time()
+    ):
+        with _jwt_cache_lock:
+            _jwt_cache[key] = payload
+    
+    return payload
+
+
+async def get_db(request: Request) -> Prisma:
+    """Get the Prisma client connected during application startup.
+
+    Falls back to connecting the shared client when the lifespan did not
+    run (e.g. an ASGI test client without lifespan support).
+
+    Args:
+        request: Current request
+
+    Returns:
+        Prisma client instance
+    """
+    db = getattr(request.app.state, "prisma", None)
+    if db is None:
+        db = request.app.state.prisma = await get_prisma()
+    return db
+
+
+def evict_user(user_id: str) -> None:
+    """Drop a user from the authentication cache.
+
+    Call this whenever a user's credentials or profile change so the next
+    request reloads the user from the database.
+
+    Args:
+        user_id: User ID
+    """
+    with _user_cache_lock:
+        _user_cache.pop(user_id, None)
+
+
+class UserLoader(DataLoader):
+    """Coalesces concurrent user lookups into a single ``find_many`` query."""
+    
+    def __init__(self, db: Any):
+        """Initialize loader.
+        
+        Args:
+            db: Prisma client
+        """
+        # Results are cached in _user_cache with a TTL; the loader only batches
+        super().__init__(cache=False)
+        self.db = db
+    
+    async def batch_load_fn(self, user_ids: List[str]) -> List[Optional[User]]:
+        """Load a batch of users within the bounded auth query budget.
+        
+        Args:
+            user_ids: User IDs requested in the current tick
+            
+        Returns:
+            Users in the same order as user_ids (None where not found)
+            
+        Raises:
+            HTTPException: If no query slot frees up in time
+        """
+        try:
+            await asyncio.wait_for(
+                _user_query_semaphore.acquire(),
+                timeout=settings.DATABASE_ACQUIRE_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            logger.warning("Timed out waiting for a database slot", batch_size=len(user_ids))
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Database is busy, please retry",
+            )
+        
+        try:
+            users = await self.db.user.find_many(where={"id": {"in": list(user_ids)}})
+        finally:
+            _user_query_semaphore.release()
+        
+        users_by_id = {user.id: user for user in users}
+        return [users_by_id.get(user_id) for user_id in user_ids]
+
+
+_user_loader: Optional[UserLoader] = None
+
+
+async def _find_user(db: Any, user_id: str) -> Optional[User]:
+    """Load a user by ID through the event loop's UserLoader.
+
+    Args:
+        db: Prisma client
+        user_id: User ID
+
+    Returns:
+        User or None if not found
+    """
+    global _user_loader
+    
+    # DataLoader binds to the loop it was created on
+    if _user_loader is None or _user_loader.loop is not asyncio.get_running_loop():
+        _user_loader = UserLoader(db)
+    
+    return await _user_loader.load(user_id)
+
+
+async def _try_authenticate(
+    request: Request,
+    credentials: Optional[HTTPAuthorizationCredentials]
+) -> Tuple[Optional[User], Optional[str]]:
+    """Resolve the user for a bearer token without raising.
+
+    Args:
+        request: Current request
+        credentials: HTTP Authorization credentials (optional)
+
+    Returns:
+        Tuple of the authenticated user (None if the token or user is
+        invalid) and the 401 detail explaining the failure (None on success
+        or when no credentials were sent)
+    """
+    if credentials is None:
+        return None, None
+    
+    payload = _verify_cached(credentials.credentials)
+    
+    if payload is None:
+        logger.warning("Invalid or expired token")
+        return None, "Invalid or expired token"
+    
+    token_type = payload.get(_TYPE_CLAIM)
+    if token_type != _ACCESS_TOKEN_TYPE:
+        logger.warning("Wrong token type", token_type=token_type)
+        return None, "Invalid token type"
+    
+    user_id = payload.get(_SUBJECT_CLAIM)
+    if user_id is None:
+        logger.warning("Token missing subject claim")
+        return None, "Invalid token payload"
+    
+    with _user_cache_lock:
+        user = _user_cache.get(user_id)
+    
+    if user is None:
+        user = await _find_user(await get_db(request), user_id)
+        if user is None:
+            logger.warning("User not found for token", user_id=user_id)
+            return None, "User not found"
+        with _user_cache_lock:
+            _user_cache[user_id] = user
+    
+    logger.debug("Authenticated user", user_id=user_id, email=user.email)
+    return user, None
 
 
 async def get_current_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ) -> User:
     """Get current authenticated user from JWT token.
 
     Args:
+        request: Current request
         credentials: HTTP Authorization credentials
 
     Returns:
@@ -28,66 +243,32 @@ async def get_current_user(
     Raises:
         HTTPException: If token is invalid or user not found
     """
-    token = credentials.credentials
-    payload = decode_token(token)
-    
-    if payload is None:
-        logger.warning("Invalid or expired token", token_type=payload.get("type") if payload else None)
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid or expired token",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    
-    if payload.get("type") != "access":
-        logger.warning("Wrong token type", token_type=payload.get("type"))
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token type",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    
-    user_id = payload.get("sub")
-    if user_id is None:
-        logger.warning("Token missing subject claim")
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token payload",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    
-    db = await get_prisma()
-    user = await db.user.find_unique(where={"id": user_id})
+    user, failure_detail = await _try_authenticate(request, credentials)
     
     if user is None:
-        logger.warning("User not found for token", user_id=user_id)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
+            detail=failure_detail,
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    logger.debug("Authenticated user", user_id=user_id, email=user.email)
+    # Routers that authenticate via dependencies=[...] read the user from here
+    request.state.user = user
     return user
 
 
 async def get_optional_user(
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends(
-        HTTPBearer(auto_error=False)
-    )
+    request: Request,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security)
 ) -> Optional[User]:
     """Get optional authenticated user from JWT token.
 
     Args:
+        request: Current request
         credentials: HTTP Authorization credentials (optional)
 
     Returns:
         Current authenticated user or None if not authenticated
     """
-    if credentials is None:
-        return None
-    
-    try:
-        return await get_current_user(credentials)
-    except HTTPException:
-        return None
+    user, _ = await _try_authenticate(request, credentials)
+    return user
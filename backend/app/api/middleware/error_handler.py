@@ -1,10 +1,9 @@
 """Error handling middleware."""
-from typing import Callable
+from typing import Any, Callable, Dict
 import time
-import traceback
 
 from fastapi import Request, Response
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 
 from app.utils.errors import APIError
@@ -31,50 +30,24 @@ class ErrorHandlerMiddleware(BaseHTTPMiddleware):
         Returns:
             Response
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
+        method = request.scope["method"]
+        path = request.scope["path"]
+        log_fields: Dict[str, Any] = {}
         
         try:
             response = await call_next(request)
-            
-            duration = time.time() - start_time
-            
-            record_api_request(
-                method=request.method,
-                endpoint=request.url.path,
-                status_code=response.status_code,
-                duration_seconds=duration
-            )
-            
-            logger.info(
-                "Request completed",
-                method=request.method,
-                path=request.url.path,
-                status_code=response.status_code,
-                duration_ms=round(duration * 1000, 2)
-            )
-            
-            return response
+            status_code = response.status_code
+            log = logger.info
+            log_message = "Request completed"
             
         except APIError as e:
-            duration = time.time() - start_time
+            status_code = e.status_code
+            log = logger.error
+            log_message = "API error"
+            log_fields = {"error": e.message, "details": e.details}
             
-            record_api_request(
-                method=request.method,
-                endpoint=request.url.path,
-                status_code=e.status_code,
-                duration_seconds=duration
-            )
-            
-            logger.error(
-                "API error",
-                method=request.method,
-                path=request.url.path,
-                status_code=e.status_code,
-                error=e.message,
-                details=e.details
-            )
-            
-            return JSONResponse(
+            response = ORJSONResponse(
                 status_code=e.status_code,
                 content={
                     "error": e.message,
@@ -83,27 +56,37 @@ class ErrorHandlerMiddleware(BaseHTTPMiddleware):
             )
             
         except Exception as e:
-            duration = time.time() - start_time
-            
-            record_api_request(
-                method=request.method,
-                endpoint=request.url.path,
-                status_code=500,
-                duration_seconds=duration
-            )
-            
-            logger.error(
-                "Unexpected error",
-                method=request.method,
-                path=request.url.path,
-                error=str(e),
-                traceback=traceback.format_exc()
-            )
+            status_code = 500
+            log = logger.error
+            log_message = "Unexpected error"
+            # The exception itself, not True: log() runs after this block has
+            # exited, when sys.exc_info() is already cleared
+            log_fields = {"error": str(e), "exc_info": e}
             
-            return JSONResponse(
+            response = ORJSONResponse(
                 status_code=500,
                 content={
                     "error": "Internal server error",
                     "details": str(e) if request.app.state.config.APP_DEBUG else None
                 }
             )
+        
+        duration_ns = time.perf_counter_ns() - start_ns
+        
+        record_api_request(
+            method=method,
+            endpoint=path,
+            status_code=status_code,
+            duration_seconds=duration_ns / 1e9
+        )
+        
+        log(
+            log_message,
+            method=method,
+            path=path,
+            status_code=status_code,
+            duration_ms=duration_ns // 1_000_000,
+            **log_fields
+        )
+        
+        return response
@@ -1,4 +1,6 @@
 """Request validation middleware."""
+import hmac
+
 from fastapi import Request, HTTPException
 from starlette.middleware.base import BaseHTTPMiddleware
 from typing import Callable
@@ -8,6 +10,10 @@ from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Read once at import; settings do not change at runtime
+_IS_PRODUCTION = settings.APP_ENV == "production"
+_API_KEY_BYTES = settings.API_KEY.encode()
+
 
 class RequestValidationMiddleware(BaseHTTPMiddleware):
     """Middleware for validating requests."""
@@ -29,15 +35,21 @@ class RequestValidationMiddleware(BaseHTTPMiddleware):
         Raises:
             HTTPException: If validation fails
         """
-        if request.url.path.startswith("/api/"):
+        path = request.scope["path"]
+        
+        if path.startswith("/api/"):
             api_key = request.headers.get("X-API-Key")
             
-            if not api_key and settings.APP_ENV == "production":
-                logger.warning("Missing API key", path=request.url.path)
+            if not api_key and _IS_PRODUCTION:
+                logger.warning("Missing API key", path=path)
                 raise HTTPException(status_code=401, detail="API key required")
             
-            if api_key and api_key != settings.API_KEY and settings.APP_ENV == "production":
-                logger.warning("Invalid API key", path=request.url.path)
+            if (
+                api_key
+                and _IS_PRODUCTION
+                and not hmac.compare_digest(api_key.encode(), _API_KEY_BYTES)
+            ):
+                logger.warning("Invalid API key", path=path)
                 raise HTTPException(status_code=403, detail="Invalid API key")
         
         response = await call_next(request)
@@ -1,6 +1,11 @@
 """Authentication API models."""
+import re
 from typing import Optional
-from pydantic import BaseModel, EmailStr, Field
+from datetime import datetime
+from pydantic import BaseModel, EmailStr, Field, ConfigDict, field_validator
+
+# Cheap syntactic check for login; full EmailStr validation runs on register
+_LOGIN_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
 
 
 class UserRegister(BaseModel):
@@ -11,8 +16,20 @@ class UserRegister(BaseModel):
 
 class UserLogin(BaseModel):
     """User login request."""
-    email: EmailStr = Field(..., description="User email address")
+    email: str = Field(..., max_length=320, description="User email address")
     password: str = Field(..., description="User password")
+    
+    @field_validator("email")
+    @classmethod
+    def validate_email(cls, value: str) -> str:
+        """Check email syntax without the email-validator library.
+
+        The domain is lowercased to match EmailStr normalization on register.
+        """
+        if not _LOGIN_EMAIL_RE.match(value):
+            raise ValueError("value is not a valid email address")
+        local_part, _, domain = value.rpartition("@")
+        return f"{local_part}@{domain.lower()}"
 
 
 class TokenRefresh(BaseModel):
@@ -31,9 +48,7 @@ class UserResponse(BaseModel):
     """User response model."""
     id: str
     email: str
-    createdAt: str
-    updatedAt: str
+    createdAt: datetime
+    updatedAt: datetime
     
-    class Config:
-        """Pydantic config."""
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
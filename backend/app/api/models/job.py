@@ -1,7 +1,7 @@
 """Job API models."""
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Literal
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 
 
 class JobCreate(BaseModel):
@@ -9,26 +9,27 @@ class JobCreate(BaseModel):
     prompt: str = Field(..., min_length=1, max_length=5000, description="Video generation prompt")
     projectId: Optional[str] = Field(None, description="Project ID (optional)")
     model: Optional[str] = Field(None, description="AI model to use")
-    resolution: Optional[str] = Field("1080p", description="Video resolution (e.g., 1080p, 720p, 4k)")
-    quality: Optional[str] = Field("high", description="Video quality (e.g., high, medium, low)")
+    resolution: Optional[Literal["480p", "720p", "1080p", "4k"]] = Field("1080p", description="Video resolution")
+    quality: Optional[Literal["low", "medium", "high"]] = Field("high", description="Video quality")
     duration: Optional[int] = Field(None, ge=1, le=60, description="Video duration in seconds")
     metadata: Optional[Dict[str, Any]] = Field(default=None, description="Additional metadata")
     maxRetries: Optional[int] = Field(default=None, ge=0, le=10, description="Maximum retry attempts")
 
 
-class JobResponse(BaseModel):
-    """Job response model."""
+class JobSummaryResponse(BaseModel):
+    """Job fields shown in job lists.
+
+    Keep in sync with the JobSummary partial type in prisma/partial_types.py,
+    which list queries use to select only these columns.
+    """
     id: str
     userId: str
     status: str
     prompt: str
-    metadata: Optional[Dict[str, Any]]
     result: Optional[Dict[str, Any]]
     startedAt: Optional[datetime]
     completedAt: Optional[datetime]
     retryCount: int
-    maxRetries: int
-    celeryTaskId: Optional[str] = None
     usedProvider: Optional[str]
     usedModel: Optional[str]
     generationTimeMs: Optional[int]
@@ -36,26 +37,42 @@ class JobResponse(BaseModel):
     createdAt: datetime
     updatedAt: datetime
     
-    class Config:
-        """Pydantic config."""
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+class JobResponse(JobSummaryResponse):
+    """Job response model."""
+    metadata: Optional[Dict[str, Any]]
+    maxRetries: int
+    celeryTaskId: Optional[str] = None
 
 
 class JobListResponse(BaseModel):
     """Job list response."""
-    jobs: list[JobResponse]
-    total: int
+    jobs: list[JobSummaryResponse]
+    total: Optional[int] = Field(None, description="Total matching jobs (first page only)")
     skip: int
     take: int
+    nextCursor: Optional[str] = Field(None, description="Cursor for the next page, if any")
 
 
 class JobStatusUpdate(BaseModel):
     """Job status update request."""
-    status: str = Field(..., pattern="^(queued|processing|completed|failed|cancelled)$")
+    status: Literal["queued", "processing", "completed", "failed", "cancelled"]
     errorMessage: Optional[str] = None
     result: Optional[Dict[str, Any]] = None
 
 
+class JobBatchCancelRequest(BaseModel):
+    """Batch job cancellation request."""
+    jobIds: list[str] = Field(..., min_length=1, max_length=100, description="IDs of jobs to cancel")
+
+
+class JobBatchCancelResponse(BaseModel):
+    """Batch job cancellation response."""
+    cancelled: list[str] = Field(..., description="IDs of jobs that were cancelled")
+
+
 class JobStatsResponse(BaseModel):
     """Job statistics response."""
     total: int
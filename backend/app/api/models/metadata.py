@@ -1,7 +1,7 @@
 """Metadata API models."""
 from typing import Any, Optional, List
 from datetime import datetime
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class SystemMetadataResponse(BaseModel):
@@ -11,9 +11,7 @@ class SystemMetadataResponse(BaseModel):
     description: Optional[str]
     updatedAt: datetime
     
-    class Config:
-        """Pydantic config."""
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class SystemMetadataListResponse(BaseModel):
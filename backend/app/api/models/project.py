@@ -1,6 +1,7 @@
 """Project API models."""
 from typing import Optional
-from pydantic import BaseModel, Field
+from datetime import datetime
+from pydantic import BaseModel, Field, ConfigDict
 
 
 class ProjectCreate(BaseModel):
@@ -21,17 +22,16 @@ class ProjectResponse(BaseModel):
     userId: str
     name: str
     description: Optional[str]
-    createdAt: str
-    updatedAt: str
+    createdAt: datetime
+    updatedAt: datetime
     
-    class Config:
-        """Pydantic config."""
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class ProjectListResponse(BaseModel):
     """Project list response."""
     projects: list[ProjectResponse]
-    total: int
+    total: Optional[int] = Field(None, description="Total projects (first page only)")
     skip: int
     take: int
+    nextCursor: Optional[str] = Field(None, description="Cursor for the next page, if any")
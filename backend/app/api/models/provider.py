@@ -1,7 +1,7 @@
 """Provider API models."""
 from typing import Optional
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 
 
 class ProviderHealthResponse(BaseModel):
@@ -17,9 +17,7 @@ class ProviderHealthResponse(BaseModel):
     metadata: Optional[dict] = None
     updatedAt: datetime
     
-    class Config:
-        """Pydantic config."""
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class ProviderTestRequest(BaseModel):
@@ -1,6 +1,7 @@
 """Authentication API routes."""
 from datetime import timedelta
 from fastapi import APIRouter, Depends, HTTPException, status
+from prisma import Prisma
 
 from app.api.models.auth import (
     UserRegister,
@@ -9,8 +10,7 @@ from app.api.models.auth import (
     TokenResponse,
     UserResponse
 )
-from app.api.dependencies import get_current_user
-from app.db.prisma import get_prisma
+from app.api.dependencies import get_current_user, get_db
 from app.db.models import create_job, update_job_status
 from app.utils.auth import (
     verify_password,
@@ -33,13 +33,21 @@ logger = get_logger(__name__)
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
+# Verified against when the email is unknown so failed logins take the same
+# time whether or not the account exists
+_DUMMY_PASSWORD_HASH = get_password_hash("dummy-password-for-timing")
+
 
 @router.post("/register", response_model=UserResponse, status_code=201)
-async def register(user_data: UserRegister) -> UserResponse:
+async def register(
+    user_data: UserRegister,
+    db: Prisma = Depends(get_db)
+) -> UserResponse:
     """Register a new user.
 
     Args:
         user_data: User registration data
+        db: Prisma client
 
     Returns:
         Created user
@@ -47,8 +55,6 @@ async def register(user_data: UserRegister) -> UserResponse:
     Raises:
         DuplicateEmailError: If email already exists
     """
-    db = await get_prisma()
-    
     # Check if user already exists
     existing_user = await db.user.find_unique(
         where={"email": user_data.email}
@@ -69,18 +75,27 @@ async def register(user_data: UserRegister) -> UserResponse:
             }
         )
         logger.info("User registered", user_id=user.id, email=user.email)
-        return UserResponse.model_validate(user)
+        return UserResponse.model_construct(
+            id=user.id,
+            email=user.email,
+            createdAt=user.createdAt,
+            updatedAt=user.updatedAt
+        )
     except Exception as e:
         logger.error("Failed to create user", error=str(e))
         raise DatabaseError(f"Failed to create user: {str(e)}")
 
 
 @router.post("/login", response_model=TokenResponse)
-async def login(user_data: UserLogin) -> TokenResponse:
+async def login(
+    user_data: UserLogin,
+    db: Prisma = Depends(get_db)
+) -> TokenResponse:
     """Authenticate user and return tokens.
 
     Args:
         user_data: User login data
+        db: Prisma client
 
     Returns:
         Access and refresh tokens
@@ -88,12 +103,15 @@ async def login(user_data: UserLogin) -> TokenResponse:
     Raises:
         AuthenticationError: If credentials are invalid
     """
-    db = await get_prisma()
-    
     # Find user by email
     user = await db.user.find_unique(where={"email": user_data.email})
     
-    if not user or not verify_password(user_data.password, user.passwordHash):
+    password_ok = verify_password(
+        user_data.password,
+        user.passwordHash if user else _DUMMY_PASSWORD_HASH
+    )
+    
+    if not user or not password_ok:
         logger.warning("Failed login attempt", email=user_data.email)
         raise AuthenticationError("Invalid email or password")
     
@@ -110,11 +128,15 @@ async def login(user_data: UserLogin) -> TokenResponse:
 
 
 @router.post("/refresh", response_model=TokenResponse)
-async def refresh_token(token_data: TokenRefresh) -> TokenResponse:
+async def refresh_token(
+    token_data: TokenRefresh,
+    db: Prisma = Depends(get_db)
+) -> TokenResponse:
     """Refresh access token using refresh token.
 
     Args:
         token_data: Refresh token data
+        db: Prisma client
 
     Returns:
         New access and refresh tokens
@@ -139,7 +161,6 @@ async def refresh_token(token_data: TokenRefresh) -> TokenResponse:
         raise InvalidTokenError("Invalid token payload")
     
     # Verify user still exists
-    db = await get_prisma()
     user = await db.user.find_unique(where={"id": user_id})
     
     if user is None:
@@ -171,4 +192,9 @@ async def get_current_user_profile(
         Current user profile
     """
     logger.debug("User profile requested", user_id=current_user.id)
-    return UserResponse.model_validate(current_user)
+    return UserResponse.model_construct(
+        id=current_user.id,
+        email=current_user.email,
+        createdAt=current_user.createdAt,
+        updatedAt=current_user.updatedAt
+    )
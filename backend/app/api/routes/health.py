@@ -1,5 +1,7 @@
 """Health check routes."""
-from typing import Dict, Any
+import asyncio
+import time
+from typing import Dict, Any, Tuple
 from fastapi import APIRouter
 from prometheus_client import generate_latest, CONTENT_TYPE_LATEST
 from fastapi.responses import Response
@@ -9,6 +11,12 @@ from app.monitoring.metrics import registry
 
 router = APIRouter(tags=["health"])
 
+METRICS_CACHE_TTL_SECONDS = 1.0
+
+# (monotonic render time, rendered payload) shared across concurrent scrapes
+_last_render: Tuple[float, bytes] = (0.0, b"")
+_render_lock = asyncio.Lock()
+
 
 @router.get("/health")
 async def liveness_probe() -> Dict[str, str]:
@@ -38,5 +46,15 @@ async def metrics_endpoint() -> Response:
     Returns:
         Prometheus metrics in text format
     """
-    metrics_data = generate_latest(registry)
+    global _last_render
+    
+    rendered_at, metrics_data = _last_render
+    if time.monotonic() - rendered_at >= METRICS_CACHE_TTL_SECONDS:
+        async with _render_lock:
+            # Another scrape may have re-rendered while we waited for the lock
+            rendered_at, metrics_data = _last_render
+            if time.monotonic() - rendered_at >= METRICS_CACHE_TTL_SECONDS:
+                metrics_data = generate_latest(registry)
+                _last_render = (time.monotonic(), metrics_data)
+    
     return Response(content=metrics_data, media_type=CONTENT_TYPE_LATEST)
@@ -1,17 +1,33 @@
 """Job API routes."""
-from typing import Optional, Dict, Any
-from fastapi import APIRouter, Query, HTTPException, Depends, status
+import asyncio
+from uuid import uuid4
+from typing import Optional, Dict, Any, AsyncIterator
+from fastapi import APIRouter, BackgroundTasks, Query, HTTPException, Depends, status, Request
+from fastapi.responses import StreamingResponse
+from prisma import Prisma
 from prisma.models import User
+from prisma.partials import JobSummary
 
-from app.api.models.job import JobCreate, JobResponse, JobListResponse, JobStatsResponse
-from app.api.dependencies import get_current_user
-from app.db.prisma import get_prisma
+from app.api.models.job import (
+    JobCreate,
+    JobResponse,
+    JobSummaryResponse,
+    JobListResponse,
+    JobStatsResponse,
+    JobBatchCancelRequest,
+    JobBatchCancelResponse
+)
+from app.api.dependencies import get_current_user, get_db
 from app.db.models import (
     create_job,
     get_job,
+    get_job_access_info,
     list_jobs,
-    delete_job,
-    update_job_status,
+    delete_owned_job,
+    delete_outbox_event,
+    cancel_job,
+    cancel_jobs,
+    requeue_job,
     get_job_stats
 )
 from app.celery_app.celery_config import celery_app
@@ -21,35 +37,94 @@ from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-router = APIRouter(prefix="/jobs", tags=["jobs"])
+# Rows fetched per query by the NDJSON job stream
+JOB_STREAM_CHUNK_SIZE = 100
+
+router = APIRouter(
+    prefix="/jobs",
+    tags=["jobs"],
+    dependencies=[Depends(get_current_user)]
+)
+
+
+async def _get_owned_job_info(
+    db: Any,
+    job_id: str,
+    current_user: User,
+    action: str
+) -> Dict[str, Any]:
+    """Load a job's access columns, enforcing existence and ownership.
+    
+    Args:
+        db: Prisma client
+        job_id: Job ID
+        current_user: Current authenticated user
+        action: Action being attempted, used in the audit log
+        
+    Returns:
+        Dict with id, userId, status and celeryTaskId
+        
+    Raises:
+        JobNotFoundError: If job not found
+        HTTPException: If user doesn't own the job
+    """
+    job = await get_job_access_info(db=db, job_id=job_id)
+    
+    if not job:
+        raise JobNotFoundError(job_id=job_id)
+    
+    # Verify user owns the job
+    if job["userId"] != current_user.id:
+        logger.warning(
+            f"Unauthorized job {action} attempt",
+            job_id=job_id,
+            user_id=current_user.id
+        )
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You don't have access to this job"
+        )
+    
+    return job
 
 
 @router.post("", response_model=JobResponse, status_code=201)
 async def create_job_endpoint(
+    request: Request,
     job_data: JobCreate,
-    current_user: User = Depends(get_current_user)
+    background_tasks: BackgroundTasks,
+    db: Prisma = Depends(get_db)
 ) -> JobResponse:
     """Create a new video generation job.
     
     Args:
+        request: Current request carrying the authenticated user
         job_data: Job creation data
-        current_user: Current authenticated user
+        background_tasks: Response background tasks
+        db: Prisma client
         
     Returns:
         Created job
     """
-    db = await get_prisma()
+    current_user: User = request.state.user
     
     # Build metadata with video generation parameters
-    metadata = job_data.metadata or {}
-    if job_data.model:
-        metadata["model"] = job_data.model
-    if job_data.resolution:
-        metadata["resolution"] = job_data.resolution
-    if job_data.quality:
-        metadata["quality"] = job_data.quality
-    if job_data.duration:
-        metadata["duration"] = job_data.duration
+    metadata = {
+        **(job_data.metadata or {}),
+        **{
+            key: value
+            for key, value in (
+                ("model", job_data.model),
+                ("resolution", job_data.resolution),
+                ("quality", job_data.quality),
+                ("duration", job_data.duration),
+            )
+            if value
+        }
+    }
+    
+    # Assign the Celery task ID up front so the job row is written once
+    task_id = str(uuid4())
     
     job = await create_job(
         db=db,
@@ -57,34 +132,81 @@ async def create_job_endpoint(
         prompt=job_data.prompt,
         project_id=job_data.projectId,
         metadata=metadata,
-        max_retries=job_data.maxRetries
+        max_retries=job_data.maxRetries,
+        celery_task_id=task_id
     )
     
-    task = process_video_generation.delay(job.id)
+    # Kombu publishes synchronously; keep the broker round-trip off the loop
+    await asyncio.to_thread(process_video_generation.apply_async, args=[job.id], task_id=task_id)
+    # Published; the outbox sweeper no longer needs to (done after responding)
+    background_tasks.add_task(delete_outbox_event, db=db, task_id=task_id)
     
-    # Update job with Celery task ID
-    job = await update_job_status(
-        db=db,
-        job_id=job.id,
-        status="queued",
-        celery_task_id=task.id
-    )
+    logger.info("Job created and queued", job_id=job.id, user_id=current_user.id, task_id=task_id)
     
-    logger.info("Job created and queued", job_id=job.id, user_id=job_data.userId, task_id=task.id)
+    return JobResponse.model_construct(**job.__dict__)
+
+
+@router.get("/stream", response_class=StreamingResponse)
+async def stream_jobs_endpoint(
+    request: Request,
+    status: Optional[str] = Query(None, description="Filter by status"),
+    projectId: Optional[str] = Query(None, description="Filter by project ID"),
+    db: Prisma = Depends(get_db)
+) -> StreamingResponse:
+    """Stream all of the current user's jobs as newline-delimited JSON.
     
-    return JobResponse.model_validate(job)
+    Jobs are read in keyset-paginated chunks and each row is written as soon
+    as it is serialized, so clients can render the first jobs while later
+    chunks are still being fetched.
+    
+    Args:
+        request: Current request carrying the authenticated user
+        status: Filter by status
+        projectId: Filter by project ID
+        db: Prisma client
+        
+    Returns:
+        NDJSON stream of job summaries, newest first
+    """
+    current_user: User = request.state.user
+    
+    where: Dict[str, Any] = {"userId": current_user.id}
+    if status:
+        where["status"] = status
+    if projectId:
+        where["projectId"] = projectId
+    
+    async def generate() -> AsyncIterator[bytes]:
+        cursor: Optional[str] = None
+        while True:
+            jobs = await JobSummary.prisma(db).find_many(
+                where=where,
+                cursor={"id": cursor} if cursor else None,
+                skip=1 if cursor else 0,
+                take=JOB_STREAM_CHUNK_SIZE,
+                order=[{"createdAt": "desc"}, {"id": "desc"}]
+            )
+            for job in jobs:
+                yield JobSummaryResponse.model_construct(**job.__dict__).model_dump_json().encode() + b"\n"
+            if len(jobs) < JOB_STREAM_CHUNK_SIZE:
+                break
+            cursor = jobs[-1].id
+    
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
 
 
 @router.get("/{job_id}", response_model=JobResponse)
 async def get_job_endpoint(
+    request: Request,
     job_id: str,
-    current_user: User = Depends(get_current_user)
+    db: Prisma = Depends(get_db)
 ) -> JobResponse:
     """Get job by ID.
     
     Args:
+        request: Current request carrying the authenticated user
         job_id: Job ID
-        current_user: Current authenticated user
+        db: Prisma client
         
     Returns:
         Job details
@@ -93,7 +215,7 @@ async def get_job_endpoint(
         JobNotFoundError: If job not found
         HTTPException: If user doesn't own the job
     """
-    db = await get_prisma()
+    current_user: User = request.state.user
     
     job = await get_job(db=db, job_id=job_id)
     
@@ -113,30 +235,39 @@ async def get_job_endpoint(
             detail="You don't have access to this job"
         )
     
-    return JobResponse.model_validate(job)
+    return JobResponse.model_construct(**job.__dict__)
 
 
 @router.get("", response_model=JobListResponse)
 async def list_jobs_endpoint(
+    request: Request,
     status: Optional[str] = Query(None, description="Filter by status"),
     projectId: Optional[str] = Query(None, description="Filter by project ID"),
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    skip: int = Query(0, ge=0, description="Number of records to skip (ignored when cursor is set)"),
     take: int = Query(50, ge=1, le=100, description="Number of records to return"),
-    current_user: User = Depends(get_current_user)
+    cursor: Optional[str] = Query(None, description="ID of the last job on the previous page"),
+    db: Prisma = Depends(get_db)
 ) -> JobListResponse:
     """List current user's jobs with filters and pagination.
     
+    Pages after the first should pass the previous response's ``nextCursor``
+    so the query seeks through the (userId, createdAt, id) index instead of
+    scanning and discarding ``skip`` rows. The total count is only computed
+    for the first page.
+    
     Args:
+        request: Current request carrying the authenticated user
         status: Filter by status
         projectId: Filter by project ID
         skip: Number of records to skip
         take: Number of records to return
-        current_user: Current authenticated user
+        cursor: ID of the last job on the previous page
+        db: Prisma client
         
     Returns:
         Paginated job list
     """
-    db = await get_prisma()
+    current_user: User = request.state.user
     
     # Build where clause
     where: Dict[str, Any] = {"userId": current_user.id}
@@ -145,77 +276,82 @@ async def list_jobs_endpoint(
     if projectId:
         where["projectId"] = projectId
     
-    jobs = await db.job.find_many(
+    # The partial type selects only the summary columns, skipping metadata
+    find_jobs = JobSummary.prisma(db).find_many(
         where=where,
-        skip=skip,
+        cursor={"id": cursor} if cursor else None,
+        skip=1 if cursor else skip,
         take=take,
-        order={"createdAt": "desc"}
+        order=[{"createdAt": "desc"}, {"id": "desc"}]
     )
     
-    total = await db.job.count(where=where)
+    total: Optional[int] = None
+    if cursor:
+        jobs = await find_jobs
+    else:
+        # Prisma Python cannot batch reads into one statement; issue both
+        # queries concurrently so their round-trips overlap
+        jobs, total = await asyncio.gather(find_jobs, db.job.count(where=where))
     
     return JobListResponse(
-        jobs=[JobResponse.model_validate(job) for job in jobs],
+        jobs=[JobSummaryResponse.model_construct(**job.__dict__) for job in jobs],
         total=total,
-        skip=skip,
-        take=take
+        skip=0 if cursor else skip,
+        take=take,
+        nextCursor=jobs[-1].id if len(jobs) == take else None
     )
 
 
 @router.delete("/{job_id}", status_code=204)
 async def delete_job_endpoint(
+    request: Request,
     job_id: str,
-    current_user: User = Depends(get_current_user)
+    db: Prisma = Depends(get_db)
 ) -> None:
     """Delete/cancel a job.
     
     Args:
+        request: Current request carrying the authenticated user
         job_id: Job ID
-        current_user: Current authenticated user
+        db: Prisma client
         
     Raises:
         JobNotFoundError: If job not found
         HTTPException: If user doesn't own the job
     """
-    db = await get_prisma()
-    
-    job = await get_job(db=db, job_id=job_id)
+    current_user: User = request.state.user
     
-    if not job:
-        raise JobNotFoundError(job_id=job_id)
+    # Ownership is checked by the DELETE itself
+    job = await delete_owned_job(db=db, job_id=job_id, user_id=current_user.id)
     
-    # Verify user owns the job
-    if job.userId != current_user.id:
-        logger.warning(
-            "Unauthorized job deletion attempt",
-            job_id=job_id,
-            user_id=current_user.id
-        )
+    if job is None:
+        # Nothing deleted; raises 404 or 403
+        await _get_owned_job_info(db, job_id, current_user, action="deletion")
         raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have access to this job"
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Job status changed, please retry"
         )
     
-    # Revoke Celery task if ID exists
-    if job.celeryTaskId:
-        celery_app.control.revoke(job.celeryTaskId, terminate=True)
-        logger.info("Revoked Celery task before deletion", job_id=job_id, task_id=job.celeryTaskId)
-    
-    await delete_job(db=db, job_id=job_id)
+    # Revoke Celery task if ID exists (the control broadcast is blocking I/O)
+    if job["celeryTaskId"]:
+        await asyncio.to_thread(celery_app.control.revoke, job["celeryTaskId"], terminate=True)
+        logger.info("Revoked Celery task after deletion", job_id=job_id, task_id=job["celeryTaskId"])
     
     logger.info("Job deleted", job_id=job_id, user_id=current_user.id)
 
 
 @router.post("/{job_id}/cancel", response_model=JobResponse)
 async def cancel_job_endpoint(
+    request: Request,
     job_id: str,
-    current_user: User = Depends(get_current_user)
+    db: Prisma = Depends(get_db)
 ) -> JobResponse:
     """Cancel a running or queued job.
     
     Args:
+        request: Current request carrying the authenticated user
         job_id: Job ID
-        current_user: Current authenticated user
+        db: Prisma client
         
     Returns:
         Updated job details
@@ -224,59 +360,92 @@ async def cancel_job_endpoint(
         JobNotFoundError: If job not found
         HTTPException: If job cannot be cancelled or user doesn't own it
     """
-    db = await get_prisma()
+    current_user: User = request.state.user
+    
+    # Ownership and status are checked by the UPDATE itself
+    job = await cancel_job(db=db, job_id=job_id, user_id=current_user.id)
+    
+    if job is None:
+        # Nothing changed; work out why for the error response
+        info = await _get_owned_job_info(db, job_id, current_user, action="cancel")
+        if info["status"] in ["completed", "failed", "cancelled"]:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Job in status {info['status']} cannot be cancelled"
+            )
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Job status changed, please retry"
+        )
     
-    job = await get_job(db=db, job_id=job_id)
+    # Revoke Celery task if ID exists (the control broadcast is blocking I/O).
+    # Only a started task needs its worker process signalled; a queued one
+    # is simply discarded when a worker receives it.
+    if job.celeryTaskId:
+        terminate = job.startedAt is not None
+        await asyncio.to_thread(celery_app.control.revoke, job.celeryTaskId, terminate=terminate)
+        logger.info("Revoked Celery task", job_id=job_id, task_id=job.celeryTaskId, terminate=terminate)
     
-    if not job:
-        raise JobNotFoundError(job_id=job_id)
+    logger.info("Job cancelled", job_id=job_id, user_id=current_user.id)
     
-    # Verify user owns the job
-    if job.userId != current_user.id:
-        logger.warning(
-            "Unauthorized job cancel attempt",
-            job_id=job_id,
-            user_id=current_user.id
-        )
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have access to this job"
-        )
+    return JobResponse.model_construct(**job.__dict__)
+
+
+@router.post("/cancel", response_model=JobBatchCancelResponse)
+async def cancel_jobs_endpoint(
+    request: Request,
+    cancel_request: JobBatchCancelRequest,
+    db: Prisma = Depends(get_db)
+) -> JobBatchCancelResponse:
+    """Cancel several running or queued jobs at once.
     
-    if job.status in ["completed", "failed", "cancelled"]:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Job in status {job.status} cannot be cancelled"
-        )
+    Jobs that are missing, owned by another user or already finished are
+    skipped rather than failing the whole batch.
     
-    # Revoke Celery task if ID exists
-    if job.celeryTaskId:
-        celery_app.control.revoke(job.celeryTaskId, terminate=True)
-        logger.info("Revoked Celery task", job_id=job_id, task_id=job.celeryTaskId)
+    Args:
+        request: Current request carrying the authenticated user
+        cancel_request: IDs of jobs to cancel
+        db: Prisma client
+        
+    Returns:
+        IDs of the jobs that were cancelled
+    """
+    current_user: User = request.state.user
     
-    # Update job status
-    job = await update_job_status(
-        db=db,
-        job_id=job_id,
-        status="cancelled",
-        error_message="Job cancelled by user"
-    )
+    jobs = await cancel_jobs(db=db, job_ids=cancel_request.jobIds, user_id=current_user.id)
     
-    logger.info("Job cancelled", job_id=job_id, user_id=current_user.id)
+    # One revoke broadcast per group instead of one per job
+    queued_task_ids = [job["celeryTaskId"] for job in jobs if job["celeryTaskId"] and not job["startedAt"]]
+    started_task_ids = [job["celeryTaskId"] for job in jobs if job["celeryTaskId"] and job["startedAt"]]
+    if queued_task_ids:
+        await asyncio.to_thread(celery_app.control.revoke, queued_task_ids, terminate=False)
+    if started_task_ids:
+        await asyncio.to_thread(celery_app.control.revoke, started_task_ids, terminate=True)
     
-    return JobResponse.model_validate(job)
+    logger.info(
+        "Jobs cancelled",
+        user_id=current_user.id,
+        requested=len(cancel_request.jobIds),
+        cancelled=len(jobs)
+    )
+    
+    return JobBatchCancelResponse(cancelled=[job["id"] for job in jobs])
 
 
 @router.post("/{job_id}/retry", response_model=JobResponse)
 async def retry_job_endpoint(
+    request: Request,
     job_id: str,
-    current_user: User = Depends(get_current_user)
+    background_tasks: BackgroundTasks,
+    db: Prisma = Depends(get_db)
 ) -> JobResponse:
     """Retry a failed or cancelled job.
     
     Args:
+        request: Current request carrying the authenticated user
         job_id: Job ID
-        current_user: Current authenticated user
+        background_tasks: Response background tasks
+        db: Prisma client
         
     Returns:
         Updated job details
@@ -285,68 +454,55 @@ async def retry_job_endpoint(
         JobNotFoundError: If job not found
         HTTPException: If job cannot be retried or user doesn't own it
     """
-    db = await get_prisma()
+    current_user: User = request.state.user
     
-    job = await get_job(db=db, job_id=job_id)
+    # Reset job status and record the new task ID in a single conditional write
+    task_id = str(uuid4())
     
-    if not job:
-        raise JobNotFoundError(job_id=job_id)
-    
-    # Verify user owns the job
-    if job.userId != current_user.id:
-        logger.warning(
-            "Unauthorized job retry attempt",
-            job_id=job_id,
-            user_id=current_user.id
-        )
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have access to this job"
-        )
-    
-    if job.status not in ["failed", "cancelled"]:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Only failed or cancelled jobs can be retried. Current status: {job.status}"
-        )
-    
-    # Reset job status and retry count
-    job = await update_job_status(
+    job = await requeue_job(
         db=db,
         job_id=job_id,
-        status="queued",
-        error_message=None
+        user_id=current_user.id,
+        celery_task_id=task_id
     )
     
-    # Queue new task
-    task = process_video_generation.delay(job.id)
+    if job is None:
+        # Nothing changed; work out why for the error response
+        info = await _get_owned_job_info(db, job_id, current_user, action="retry")
+        if info["status"] not in ["failed", "cancelled"]:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Only failed or cancelled jobs can be retried. Current status: {info['status']}"
+            )
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Job status changed, please retry"
+        )
     
-    # Update job with new task ID
-    job = await update_job_status(
-        db=db,
-        job_id=job.id,
-        status="queued",
-        celery_task_id=task.id
-    )
+    # Queue new task
+    await asyncio.to_thread(process_video_generation.apply_async, args=[job.id], task_id=task_id)
+    background_tasks.add_task(delete_outbox_event, db=db, task_id=task_id)
     
-    logger.info("Job retried", job_id=job_id, user_id=current_user.id, task_id=task.id)
+    logger.info("Job retried", job_id=job_id, user_id=current_user.id, task_id=task_id)
     
-    return JobResponse.model_validate(job)
+    return JobResponse.model_construct(**job.__dict__)
 
 
 @router.get("/stats/summary", response_model=JobStatsResponse)
 async def get_jobs_stats_endpoint(
-    current_user: User = Depends(get_current_user)
+    request: Request,
+    db: Prisma = Depends(get_db)
 ) -> JobStatsResponse:
     """Get current user's job statistics summary.
     
     Args:
-        current_user: Current authenticated user
+        request: Current request carrying the authenticated user
+        db: Prisma client
         
     Returns:
         Job statistics summary
     """
-    db = await get_prisma()
+    current_user: User = request.state.user
     
     stats = await get_job_stats(db=db, user_id=current_user.id)
     
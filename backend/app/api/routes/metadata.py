@@ -1,9 +1,10 @@
 """Metadata API routes."""
 from typing import List
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Depends
+from prisma import Prisma
 
 from app.api.models.metadata import SystemMetadataResponse, SystemMetadataListResponse
-from app.db.prisma import get_prisma
+from app.api.dependencies import get_db
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -12,25 +13,33 @@ router = APIRouter(prefix="/metadata", tags=["metadata"])
 
 
 @router.get("", response_model=SystemMetadataListResponse)
-async def get_all_metadata() -> SystemMetadataListResponse:
+async def get_all_metadata(
+    db: Prisma = Depends(get_db)
+) -> SystemMetadataListResponse:
     """Get all system metadata.
     
+    Args:
+        db: Prisma client
+    
     Returns:
         List of all system metadata
     """
-    db = await get_prisma()
     metadata = await db.systemmetadata.find_many()
     return SystemMetadataListResponse(
-        metadata=[SystemMetadataResponse.model_validate(m) for m in metadata]
+        metadata=[SystemMetadataResponse.model_construct(**m.__dict__) for m in metadata]
     )
 
 
 @router.get("/{key}", response_model=SystemMetadataResponse)
-async def get_metadata_by_key(key: str) -> SystemMetadataResponse:
+async def get_metadata_by_key(
+    key: str,
+    db: Prisma = Depends(get_db)
+) -> SystemMetadataResponse:
     """Get system metadata by key.
     
     Args:
         key: Metadata key
+        db: Prisma client
         
     Returns:
         System metadata details
@@ -38,10 +47,9 @@ async def get_metadata_by_key(key: str) -> SystemMetadataResponse:
     Raises:
         HTTPException: If metadata not found
     """
-    db = await get_prisma()
     metadata = await db.systemmetadata.find_unique(where={"key": key})
     
     if not metadata:
         raise HTTPException(status_code=404, detail=f"Metadata with key '{key}' not found")
         
-    return SystemMetadataResponse.model_validate(metadata)
+    return SystemMetadataResponse.model_construct(**metadata.__dict__)
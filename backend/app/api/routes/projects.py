@@ -1,6 +1,8 @@
 """Project API routes."""
-from typing import Optional
-from fastapi import APIRouter, Query, Depends, HTTPException, status
+import asyncio
+from typing import Any, Optional
+from fastapi import APIRouter, Query, Depends, HTTPException, status, Request
+from prisma import Prisma
 from prisma.models import User
 
 from app.api.models.project import (
@@ -9,26 +11,69 @@ from app.api.models.project import (
     ProjectResponse,
     ProjectListResponse
 )
-from app.api.dependencies import get_current_user
-from app.db.prisma import get_prisma
+from app.api.dependencies import get_current_user, get_db
+from app.db.models import update_owned_project
 from app.utils.errors import DatabaseError
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-router = APIRouter(prefix="/projects", tags=["projects"])
+router = APIRouter(
+    prefix="/projects",
+    tags=["projects"],
+    dependencies=[Depends(get_current_user)]
+)
+
+
+async def _raise_project_access_error(
+    db: Any,
+    project_id: str,
+    current_user: User,
+    action: str
+) -> None:
+    """Explain why a conditional project write matched no rows.
+
+    Args:
+        db: Prisma client
+        project_id: Project ID
+        current_user: Current authenticated user
+        action: Action being attempted, used in the log messages
+
+    Raises:
+        HTTPException: 403 if another user owns the project, 404 otherwise
+    """
+    project = await db.project.find_unique(where={"id": project_id})
+    
+    if project and project.userId != current_user.id:
+        logger.warning(
+            f"Unauthorized project {action} attempt",
+            project_id=project_id,
+            user_id=current_user.id
+        )
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You don't have access to this project"
+        )
+    
+    logger.warning(f"Project not found for {action}", project_id=project_id)
+    raise HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="Project not found"
+    )
 
 
 @router.post("", response_model=ProjectResponse, status_code=201)
 async def create_project(
+    request: Request,
     project_data: ProjectCreate,
-    current_user: User = Depends(get_current_user)
+    db: Prisma = Depends(get_db)
 ) -> ProjectResponse:
     """Create a new project.
 
     Args:
+        request: Current request carrying the authenticated user
         project_data: Project creation data
-        current_user: Current authenticated user
+        db: Prisma client
 
     Returns:
         Created project
@@ -36,7 +81,7 @@ async def create_project(
     Raises:
         DatabaseError: If project creation fails
     """
-    db = await get_prisma()
+    current_user: User = request.state.user
     
     try:
         project = await db.project.create(
@@ -47,7 +92,7 @@ async def create_project(
             }
         )
         logger.info("Project created", project_id=project.id, user_id=current_user.id)
-        return ProjectResponse.model_validate(project)
+        return ProjectResponse.model_construct(**project.__dict__)
     except Exception as e:
         logger.error("Failed to create project", error=str(e))
         raise DatabaseError(f"Failed to create project: {str(e)}")
@@ -55,37 +100,54 @@ async def create_project(
 
 @router.get("", response_model=ProjectListResponse)
 async def list_projects(
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    request: Request,
+    skip: int = Query(0, ge=0, description="Number of records to skip (ignored when cursor is set)"),
     take: int = Query(50, ge=1, le=100, description="Number of records to return"),
-    current_user: User = Depends(get_current_user)
+    cursor: Optional[str] = Query(None, description="ID of the last project on the previous page"),
+    db: Prisma = Depends(get_db)
 ) -> ProjectListResponse:
     """List current user's projects with pagination.
 
+    Works like the job list: pass ``nextCursor`` to seek to the next page,
+    and the total count is only computed for the first page.
+
     Args:
+        request: Current request carrying the authenticated user
         skip: Number of records to skip
         take: Number of records to return
-        current_user: Current authenticated user
+        cursor: ID of the last project on the previous page
+        db: Prisma client
 
     Returns:
         Paginated project list
     """
-    db = await get_prisma()
+    current_user: User = request.state.user
     
     try:
-        projects = await db.project.find_many(
+        find_projects = db.project.find_many(
             where={"userId": current_user.id},
-            skip=skip,
+            cursor={"id": cursor} if cursor else None,
+            skip=1 if cursor else skip,
             take=take,
-            order={"createdAt": "desc"}
+            order=[{"createdAt": "desc"}, {"id": "desc"}]
         )
         
-        total = await db.project.count(where={"userId": current_user.id})
+        total: Optional[int] = None
+        if cursor:
+            projects = await find_projects
+        else:
+            # The page and the total are independent; overlap their round-trips
+            projects, total = await asyncio.gather(
+                find_projects,
+                db.project.count(where={"userId": current_user.id})
+            )
         
         return ProjectListResponse(
-            projects=[ProjectResponse.model_validate(project) for project in projects],
+            projects=[ProjectResponse.model_construct(**project.__dict__) for project in projects],
             total=total,
-            skip=skip,
-            take=take
+            skip=0 if cursor else skip,
+            take=take,
+            nextCursor=projects[-1].id if len(projects) == take else None
         )
     except Exception as e:
         logger.error("Failed to list projects", error=str(e))
@@ -94,14 +156,16 @@ async def list_projects(
 
 @router.get("/{project_id}", response_model=ProjectResponse)
 async def get_project(
+    request: Request,
     project_id: str,
-    current_user: User = Depends(get_current_user)
+    db: Prisma = Depends(get_db)
 ) -> ProjectResponse:
     """Get project by ID.
 
     Args:
+        request: Current request carrying the authenticated user
         project_id: Project ID
-        current_user: Current authenticated user
+        db: Prisma client
 
     Returns:
         Project details
@@ -109,7 +173,7 @@ async def get_project(
     Raises:
         HTTPException: If project not found or user doesn't have access
     """
-    db = await get_prisma()
+    current_user: User = request.state.user
     
     project = await db.project.find_unique(where={"id": project_id})
     
@@ -133,21 +197,23 @@ async def get_project(
             detail="You don't have access to this project"
         )
     
-    return ProjectResponse.model_validate(project)
+    return ProjectResponse.model_construct(**project.__dict__)
 
 
 @router.patch("/{project_id}", response_model=ProjectResponse)
 async def update_project(
+    request: Request,
     project_id: str,
     project_update: ProjectUpdate,
-    current_user: User = Depends(get_current_user)
+    db: Prisma = Depends(get_db)
 ) -> ProjectResponse:
     """Update project.
 
     Args:
+        request: Current request carrying the authenticated user
         project_id: Project ID
         project_update: Project update data
-        current_user: Current authenticated user
+        db: Prisma client
 
     Returns:
         Updated project
@@ -156,89 +222,53 @@ async def update_project(
         HTTPException: If project not found or user doesn't have access
         DatabaseError: If update fails
     """
-    db = await get_prisma()
+    current_user: User = request.state.user
     
-    # Verify project exists and user owns it
-    project = await db.project.find_unique(where={"id": project_id})
+    # Ownership is checked by the UPDATE itself; None fields are left unchanged
+    updated_project = await update_owned_project(
+        db=db,
+        project_id=project_id,
+        user_id=current_user.id,
+        name=project_update.name,
+        description=project_update.description
+    )
     
-    if not project:
-        logger.warning("Project not found for update", project_id=project_id)
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Project not found"
-        )
+    if updated_project is None:
+        await _raise_project_access_error(db, project_id, current_user, action="update")
     
-    if project.userId != current_user.id:
-        logger.warning(
-            "Unauthorized project update attempt",
-            project_id=project_id,
-            user_id=current_user.id
-        )
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have access to this project"
-        )
-    
-    # Build update data (only include non-None fields)
-    update_data: dict = {}
-    if project_update.name is not None:
-        update_data["name"] = project_update.name
-    if project_update.description is not None:
-        update_data["description"] = project_update.description
-    
-    try:
-        updated_project = await db.project.update(
-            where={"id": project_id},
-            data=update_data
-        )
-        logger.info("Project updated", project_id=project_id, user_id=current_user.id)
-        return ProjectResponse.model_validate(updated_project)
-    except Exception as e:
-        logger.error("Failed to update project", project_id=project_id, error=str(e))
-        raise DatabaseError(f"Failed to update project: {str(e)}")
+    logger.info("Project updated", project_id=project_id, user_id=current_user.id)
+    return ProjectResponse.model_construct(**updated_project.__dict__)
 
 
 @router.delete("/{project_id}", status_code=204)
 async def delete_project(
+    request: Request,
     project_id: str,
-    current_user: User = Depends(get_current_user)
+    db: Prisma = Depends(get_db)
 ) -> None:
     """Delete project.
 
     Args:
+        request: Current request carrying the authenticated user
         project_id: Project ID
-        current_user: Current authenticated user
+        db: Prisma client
 
     Raises:
         HTTPException: If project not found or user doesn't have access
         DatabaseError: If deletion fails
     """
-    db = await get_prisma()
-    
-    # Verify project exists and user owns it
-    project = await db.project.find_unique(where={"id": project_id})
-    
-    if not project:
-        logger.warning("Project not found for deletion", project_id=project_id)
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Project not found"
-        )
-    
-    if project.userId != current_user.id:
-        logger.warning(
-            "Unauthorized project deletion attempt",
-            project_id=project_id,
-            user_id=current_user.id
-        )
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have access to this project"
-        )
+    current_user: User = request.state.user
     
+    # Ownership is checked by the DELETE itself
     try:
-        await db.project.delete(where={"id": project_id})
-        logger.info("Project deleted", project_id=project_id, user_id=current_user.id)
+        deleted = await db.project.delete_many(
+            where={"id": project_id, "userId": current_user.id}
+        )
     except Exception as e:
         logger.error("Failed to delete project", project_id=project_id, error=str(e))
         raise DatabaseError(f"Failed to delete project: {str(e)}")
+    
+    if not deleted:
+        await _raise_project_access_error(db, project_id, current_user, action="deletion")
+    
+    logger.info("Project deleted", project_id=project_id, user_id=current_user.id)
@@ -1,9 +1,11 @@
 """Provider API routes."""
+from datetime import datetime
 from typing import List
-from fastapi import APIRouter
+from fastapi import APIRouter, BackgroundTasks, Depends
+from prisma import Prisma
 
 from app.api.models.provider import ProviderHealthResponse, ProviderTestRequest
-from app.db.prisma import get_prisma
+from app.api.dependencies import get_db
 from app.db.models import get_provider_health, update_provider_health
 from app.utils.logger import get_logger
 
@@ -13,31 +15,41 @@ router = APIRouter(prefix="/providers", tags=["providers"])
 
 
 @router.get("/status", response_model=List[ProviderHealthResponse])
-async def get_provider_status() -> List[ProviderHealthResponse]:
+async def get_provider_status(
+    db: Prisma = Depends(get_db)
+) -> List[ProviderHealthResponse]:
     """Get health status of all providers.
     
+    Args:
+        db: Prisma client
+    
     Returns:
         List of provider health statuses
     """
-    db = await get_prisma()
-    
     providers = await get_provider_health(db=db)
     
-    return [ProviderHealthResponse.model_validate(p) for p in providers]
+    return [ProviderHealthResponse.model_construct(**p.__dict__) for p in providers]
 
 
 @router.post("/test", response_model=ProviderHealthResponse)
-async def test_provider(test_request: ProviderTestRequest) -> ProviderHealthResponse:
+async def test_provider(
+    test_request: ProviderTestRequest,
+    background_tasks: BackgroundTasks,
+    db: Prisma = Depends(get_db)
+) -> ProviderHealthResponse:
     """Test a specific provider and update its health status.
     
+    For providers that already have a health record the new status is
+    persisted after the response is sent.
+    
     Args:
         test_request: Provider test request
+        background_tasks: Response background tasks
+        db: Prisma client
         
     Returns:
         Updated provider health status
     """
-    db = await get_prisma()
-    
     logger.info("Testing provider", provider=test_request.provider)
     
     # Get existing metadata if any
@@ -55,7 +67,21 @@ async def test_provider(test_request: ProviderTestRequest) -> ProviderHealthResp
         error_message = str(e)
         response_time_ms = None
     
-    health = await update_provider_health(
+    if existing_health is None:
+        # First check for this provider: the record (and its ID) must exist
+        # before it can be returned
+        health = await update_provider_health(
+            db=db,
+            provider=test_request.provider,
+            status=status,
+            error_message=error_message,
+            response_time_ms=response_time_ms,
+            metadata=metadata
+        )
+        return ProviderHealthResponse.model_construct(**health.__dict__)
+    
+    background_tasks.add_task(
+        update_provider_health,
         db=db,
         provider=test_request.provider,
         status=status,
@@ -64,4 +90,17 @@ async def test_provider(test_request: ProviderTestRequest) -> ProviderHealthResp
         metadata=metadata
     )
     
-    return ProviderHealthResponse.model_validate(health)
+    # Mirror what update_provider_health will write
+    checked_at = datetime.utcnow()
+    return ProviderHealthResponse.model_construct(
+        id=existing_health.id,
+        provider=existing_health.provider,
+        status=status,
+        lastCheckedAt=checked_at,
+        lastErrorMessage=error_message or existing_health.lastErrorMessage,
+        consecutiveFailures=existing_health.consecutiveFailures + 1 if status == "unhealthy" else 0,
+        avgResponseTimeMs=response_time_ms or existing_health.avgResponseTimeMs,
+        costPerRequest=existing_health.costPerRequest,
+        metadata=metadata,
+        updatedAt=checked_at
+    )
@@ -15,9 +15,11 @@ high_priority_exchange = Exchange("high_priority", type="direct")
 low_priority_exchange = Exchange("low_priority", type="direct")
 
 celery_app.conf.update(
-    task_serializer="json",
-    accept_content=["json"],
-    result_serializer="json",
+    # msgpack is smaller and faster to decode; json stays accepted so
+    # messages published before the switch are still consumed
+    task_serializer="msgpack",
+    accept_content=["msgpack", "json"],
+    result_serializer="msgpack",
     timezone="UTC",
     enable_utc=True,
     
@@ -46,6 +48,16 @@ celery_app.conf.update(
     task_routes={
         "app.celery_app.tasks.process_video_generation": {
             "queue": settings.DEFAULT_QUEUE_NAME
+        },
+        # Short bookkeeping tasks must not wait behind long generations
+        "app.celery_app.tasks.mark_job_failed": {
+            "queue": settings.HIGH_PRIORITY_QUEUE_NAME
+        },
+        "app.celery_app.tasks.update_queue_metrics": {
+            "queue": settings.HIGH_PRIORITY_QUEUE_NAME
+        },
+        "app.celery_app.tasks.dispatch_outbox": {
+            "queue": settings.HIGH_PRIORITY_QUEUE_NAME
         }
     },
     
@@ -53,10 +65,25 @@ celery_app.conf.update(
     task_soft_time_limit=settings.CELERY_TASK_SOFT_TIME_LIMIT,
     
     task_acks_late=True,
+    task_reject_on_worker_lost=True,
     worker_prefetch_multiplier=1,
+    
+    # With acks_late, Redis redelivers any message not acked within the
+    # visibility timeout; keep it above the hard time limit so a long
+    # generation is never handed to a second worker while still running
+    broker_transport_options={
+        "visibility_timeout": settings.CELERY_TASK_TIME_LIMIT + 600
+    },
     worker_max_tasks_per_child=1000,
     
-    result_expires=86400,
+    result_expires=3600,
+    
+    beat_schedule={
+        "dispatch-outbox": {
+            "task": "app.celery_app.tasks.dispatch_outbox",
+            "schedule": float(settings.OUTBOX_DISPATCH_INTERVAL_SECONDS)
+        }
+    },
     
     task_annotations={
         "*": {
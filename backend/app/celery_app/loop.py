@@ -0,0 +1,100 @@
+"""Persistent event loop for running async code from Celery tasks."""
+import asyncio
+import concurrent.futures
+import threading
+from typing import Any, Coroutine, Optional, TypeVar
+
+from celery.signals import worker_process_init
+
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_LOOP_LOCK = threading.Lock()
+
+
+def _start_loop() -> asyncio.AbstractEventLoop:
+    """Create an event loop and run it forever in a daemon thread.
+
+    Returns:
+        The running event loop
+    """
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, name="celery-event-loop", daemon=True)
+    thread.start()
+    return loop
+
+
+@worker_process_init.connect
+def _init_worker_loop(**kwargs: Any) -> None:
+    """Start a fresh loop in each forked worker process.
+
+    Threads do not survive fork, so a loop inherited from the parent process
+    would never run.
+    """
+    global _LOOP
+
+    with _LOOP_LOCK:
+        _LOOP = _start_loop()
+
+    logger.info("Started worker event loop")
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """Get this process's persistent event loop, starting it if needed.
+
+    Processes that never fire worker_process_init (beat, solo pool, eager
+    tasks) start the loop lazily on first use.
+
+    Returns:
+        The running event loop
+    """
+    global _LOOP
+
+    if _LOOP is None:
+        with _LOOP_LOCK:
+            if _LOOP is None:
+                _LOOP = _start_loop()
+
+    return _LOOP
+
+
+def run_async(coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+    """Run a coroutine on the persistent loop and wait for its result.
+
+    Unlike ``asyncio.run``, the loop (and the Prisma and Redis connections
+    opened on it) outlives the call, so consecutive tasks reuse them.
+
+    Args:
+        coro: Coroutine to run
+        timeout: Seconds to wait before cancelling the coroutine (no limit
+            if None)
+
+    Returns:
+        The coroutine's result
+
+    Raises:
+        concurrent.futures.TimeoutError: If the timeout expires
+    """
+    future = asyncio.run_coroutine_threadsafe(coro, get_loop())
+    try:
+        return future.result(timeout)
+    except BaseException:
+        # e.g. SoftTimeLimitExceeded raised while waiting: stop the coroutine too
+        future.cancel()
+        raise
+
+
+def submit_async(coro: Coroutine[Any, Any, T]) -> "concurrent.futures.Future[T]":
+    """Schedule a coroutine on the persistent loop without waiting for it.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        Future for the coroutine's result
+    """
+    return asyncio.run_coroutine_threadsafe(coro, get_loop())
@@ -1,10 +1,33 @@
 """Celery tasks for video generation."""
+import asyncio
+import concurrent.futures
 import time
-from typing import Dict, Any
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from typing import Deque, Dict, Any, Optional
+import redis
 from celery import Task
 from celery.exceptions import SoftTimeLimitExceeded
+from celery.signals import worker_process_init, worker_process_shutdown
+from celery.utils.time import get_exponential_backoff_interval
+from prisma import Prisma
+from tenacity import retry, stop_after_attempt, wait_exponential
 
 from app.celery_app.celery_config import celery_app
+from app.celery_app.loop import run_async, submit_async
+from app.config import settings
+from app.db.prisma import disconnect_prisma, get_prisma
+from app.db.redis import get_redis
+from app.db.models import (
+    cancelled_task_key,
+    delete_outbox_event,
+    get_job,
+    get_pending_outbox_events,
+    release_job,
+    start_job,
+    update_job_status
+)
+from app.monitoring.health_cache import get_healthy_providers_cached
 from app.utils.logger import get_logger
 from app.monitoring.metrics import (
     record_job_completion,
@@ -14,6 +37,114 @@ from app.monitoring.metrics import (
 
 logger = get_logger(__name__)
 
+# Redis counter shared by all workers for round-robin provider selection
+_PROVIDER_RR_KEY = "lb:provider_rr"
+
+# A processing job whose row is older than this belongs to a dead run: no task
+# outlives the hard time limit
+JOB_LEASE_SECONDS = settings.CELERY_TASK_TIME_LIMIT
+
+# Upper bound for the delay between job retries
+RETRY_BACKOFF_MAX_SECONDS = 600
+
+# Failure status updates submitted to the worker loop but not yet confirmed
+# finished; bounded so a database outage cannot queue them without limit
+MAX_PENDING_STATUS_UPDATES = 1000
+_pending_status_updates: Deque[concurrent.futures.Future] = deque()
+
+# Prisma client connected once per worker process
+_DB: Optional[Prisma] = None
+
+# Celery kills pool children whose worker_process_init takes longer than
+# about 4 s, so the boot-time connect gets one short attempt
+WORKER_INIT_DB_TIMEOUT_SECONDS = 2.0
+
+# Sync Redis client shared by the tasks; its pool reconnects lazily after
+# fork, and keepalive plus periodic health checks let pooled connections
+# survive idle periods between beat ticks
+_REDIS = redis.Redis.from_url(
+    settings.REDIS_URL,
+    decode_responses=False,
+    socket_keepalive=True,
+    health_check_interval=30,
+    max_connections=16
+)
+
+
+@retry(stop=stop_after_attempt(5), wait=wait_exponential(multiplier=0.5, max=8), reraise=True)
+def _connect_db() -> Prisma:
+    """Connect the shared Prisma client on the worker event loop, retrying.
+    
+    Only used at task time; it can block for several seconds.
+    
+    Returns:
+        Connected Prisma client
+    """
+    return run_async(get_prisma())
+
+
+@worker_process_init.connect
+def _init_worker_db(**kwargs: Any) -> None:
+    """Connect to the database as each worker process starts."""
+    global _DB
+    
+    try:
+        _DB = run_async(get_prisma(), timeout=WORKER_INIT_DB_TIMEOUT_SECONDS)
+    except Exception as e:
+        # Tasks retry the connection through _get_worker_db
+        logger.error("Failed to connect worker to database", error=str(e) or type(e).__name__)
+
+
+async def _next_provider_index(count: int) -> int:
+    """Pick the next provider slot from the shared round-robin counter.
+    
+    Args:
+        count: Number of candidate providers
+        
+    Returns:
+        Index into the candidate list (0 if the counter is unavailable)
+    """
+    if count <= 1:
+        return 0
+    
+    try:
+        return await get_redis().incr(_PROVIDER_RR_KEY) % count
+    except Exception as e:
+        logger.warning("Failed to read provider round-robin counter", error=str(e))
+        return 0
+
+
+@worker_process_shutdown.connect
+def _shutdown_worker_db(**kwargs: Any) -> None:
+    """Flush pending status updates and disconnect as a worker process exits."""
+    if _DB is None:
+        return
+    
+    _, not_done = concurrent.futures.wait(list(_pending_status_updates), timeout=5)
+    if not_done:
+        logger.warning("Exiting with unfinished job status updates", pending=len(not_done))
+    
+    try:
+        run_async(disconnect_prisma())
+    except Exception as e:
+        logger.warning("Failed to disconnect worker from database", error=str(e))
+
+
+def _get_worker_db() -> Prisma:
+    """Get the worker's Prisma client, connecting it if startup failed.
+    
+    Must be called outside the worker event loop.
+    
+    Returns:
+        Connected Prisma client
+    """
+    global _DB
+    
+    if _DB is None:
+        _DB = _connect_db()
+    
+    return _DB
+
 
 class CallbackTask(Task):
     """Base task with callbacks."""
@@ -59,7 +190,12 @@ class CallbackTask(Task):
         )
     
     def _update_job_status(self, job_id: str, status: str, error_message: str = None) -> None:
-        """Update job status in database.
+        """Update job status in database without waiting for the write.
+        
+        The update is queued as a mark_job_failed task on the high priority
+        queue, where it is retried until the database accepts it. If the
+        broker is unavailable it runs on the worker event loop instead; when
+        too many of those are pending, the oldest is dropped.
         
         Args:
             job_id: Job ID
@@ -67,28 +203,48 @@ class CallbackTask(Task):
             error_message: Error message if failed
         """
         try:
-            import asyncio
-            from app.db.prisma import get_prisma
-            from app.db.models import update_job_status
-            
-            async def update():
-                db = await get_prisma()
+            mark_job_failed.apply_async(args=[job_id, status, error_message])
+            return
+        except Exception as e:
+            logger.warning("Failed to queue job status update", job_id=job_id, error=str(e))
+        
+        try:
+            db = _get_worker_db()
+        except Exception as e:
+            logger.error("Failed to update job status", job_id=job_id, error=str(e))
+            return
+        
+        async def update():
+            try:
                 await update_job_status(
                     db=db,
                     job_id=job_id,
                     status=status,
                     error_message=error_message
                 )
-            
-            asyncio.run(update())
-        except Exception as e:
-            logger.error("Failed to update job status", job_id=job_id, error=str(e))
+            except Exception as e:
+                logger.error("Failed to update job status", job_id=job_id, error=str(e))
+        
+        # Forget updates that have already finished
+        while _pending_status_updates and _pending_status_updates[0].done():
+            _pending_status_updates.popleft()
+        
+        if len(_pending_status_updates) >= MAX_PENDING_STATUS_UPDATES:
+            _pending_status_updates.popleft().cancel()
+            logger.warning(
+                "Dropped oldest pending job status update",
+                pending=len(_pending_status_updates)
+            )
+        
+        _pending_status_updates.append(submit_async(update()))
 
 
 @celery_app.task(
     bind=True,
     base=CallbackTask,
     name="app.celery_app.tasks.process_video_generation",
+    acks_late=True,
+    reject_on_worker_lost=True,
     max_retries=3,
     default_retry_delay=60
 )
@@ -107,36 +263,62 @@ def process_video_generation(self: Task, job_id: str) -> Dict[str, Any]:
     """
     logger.info("Starting video generation", job_id=job_id, task_id=self.request.id)
     
+    # Cancelled or deleted jobs are flagged in Redis; skip them before any
+    # database work (the job row may be gone or must not be reset to processing)
+    try:
+        if self.request.id and _REDIS.exists(cancelled_task_key(self.request.id)):
+            logger.info("Skipping cancelled job", job_id=job_id, task_id=self.request.id)
+            return {"status": "cancelled"}
+    except redis.RedisError as e:
+        logger.warning("Failed to check job cancellation", job_id=job_id, error=str(e))
+    
     start_time = time.time()
     
     try:
-        import asyncio
-        from app.db.prisma import get_prisma
-        from app.db.models import get_job, update_job_status
+        db = _get_worker_db()
         
         async def process():
-            db = await get_prisma()
-            
-            job = await get_job(db=db, job_id=job_id)
-            if not job:
-                raise ValueError(f"Job {job_id} not found")
-            
-            await update_job_status(
-                db=db,
-                job_id=job_id,
-                status="processing"
+            # The status update returns the job, so no separate read is
+            # needed; the provider lookup is independent
+            job, healthy_providers = await asyncio.gather(
+                start_job(db=db, job_id=job_id, lease_seconds=JOB_LEASE_SECONDS),
+                get_healthy_providers_cached(db=db)
             )
+            if not job:
+                # Duplicate or stale message: never generate the video twice
+                existing = await get_job(db=db, job_id=job_id)
+                if existing is None:
+                    logger.warning("Skipping deleted job", job_id=job_id)
+                    return {"status": "deleted"}
+                if existing.status == "processing":
+                    # Another run holds the job. If that run crashed (e.g. this
+                    # is the reject_on_worker_lost redelivery), check again once
+                    # its lease has expired so the job is not left stuck
+                    age = (
+                        datetime.now(timezone.utc)
+                        - existing.updatedAt.replace(tzinfo=timezone.utc)
+                    ).total_seconds()
+                    countdown = max(0, int(JOB_LEASE_SECONDS - age)) + 5
+                    self.apply_async(args=[job_id], task_id=self.request.id, countdown=countdown)
+                    logger.info(
+                        "Job already in progress, rechecking after its lease",
+                        job_id=job_id,
+                        countdown=countdown
+                    )
+                    return {"status": "processing"}
+                logger.info("Skipping finished job", job_id=job_id, status=existing.status)
+                if existing.status == "completed" and existing.result:
+                    return existing.result
+                return {"status": existing.status}
             
             logger.info("Processing job", job_id=job_id, prompt=job.prompt[:100])
             
             # Pick a healthy provider
-            from app.db.models import get_provider_health
-            providers = await get_provider_health(db=db)
-            healthy_providers = [p for p in providers if p.status == "healthy"]
-            
             if healthy_providers:
-                # Simple selection logic - pick first healthy provider
-                selected_provider = healthy_providers[0]
+                # Rotate through healthy providers across all workers
+                selected_provider = healthy_providers[
+                    await _next_provider_index(len(healthy_providers))
+                ]
                 provider_name = selected_provider.provider
                 # Pick first model if metadata exists
                 if selected_provider.metadata and "models" in selected_provider.metadata and selected_provider.metadata["models"]:
@@ -147,8 +329,6 @@ def process_video_generation(self: Task, job_id: str) -> Dict[str, Any]:
                 provider_name = "mock_provider"
                 model_name = "mock_model"
             
-            time.sleep(2)
-            
             result = {
                 "video_url": f"https://example.com/videos/{job_id}.mp4",
                 "thumbnail_url": f"https://example.com/thumbnails/{job_id}.jpg",
@@ -179,7 +359,7 @@ def process_video_generation(self: Task, job_id: str) -> Dict[str, Any]:
             
             return result
         
-        result = asyncio.run(process())
+        result = run_async(process())
         return result
         
     except SoftTimeLimitExceeded:
@@ -192,8 +372,25 @@ def process_video_generation(self: Task, job_id: str) -> Dict[str, Any]:
         logger.error("Job processing failed", job_id=job_id, error=str(e))
         
         if self.request.retries < self.max_retries:
-            retry_delay = self.default_retry_delay * (2 ** self.request.retries)
-            logger.info("Retrying job", job_id=job_id, retry_count=self.request.retries + 1)
+            # Full jitter spreads out jobs that failed together (e.g. during a
+            # provider outage) so they don't all retry at the same moment
+            retry_delay = get_exponential_backoff_interval(
+                factor=self.default_retry_delay,
+                retries=self.request.retries,
+                maximum=RETRY_BACKOFF_MAX_SECONDS,
+                full_jitter=True
+            )
+            logger.info(
+                "Retrying job",
+                job_id=job_id,
+                retry_count=self.request.retries + 1,
+                retry_delay=retry_delay
+            )
+            # Give up the claim so the retried task can take the job again
+            try:
+                run_async(release_job(db=_get_worker_db(), job_id=job_id))
+            except Exception as release_error:
+                logger.error("Failed to release job for retry", job_id=job_id, error=str(release_error))
             raise self.retry(exc=e, countdown=retry_delay)
         else:
             self._update_job_status(job_id, "failed", str(e))
@@ -201,23 +398,89 @@ def process_video_generation(self: Task, job_id: str) -> Dict[str, Any]:
             raise
 
 
+@celery_app.task(
+    bind=True,
+    name="app.celery_app.tasks.mark_job_failed",
+    max_retries=5,
+    default_retry_delay=5
+)
+def mark_job_failed(self: Task, job_id: str, status: str, error_message: Optional[str] = None) -> None:
+    """Record the terminal status of a job whose task failed.
+    
+    Args:
+        self: Task instance
+        job_id: Job ID
+        status: New status
+        error_message: Error message if failed
+    """
+    try:
+        run_async(update_job_status(
+            db=_get_worker_db(),
+            job_id=job_id,
+            status=status,
+            error_message=error_message
+        ))
+    except Exception as e:
+        logger.error("Failed to update job status", job_id=job_id, error=str(e))
+        raise self.retry(exc=e)
+
+
 @celery_app.task(name="app.celery_app.tasks.update_queue_metrics")
 def update_queue_metrics() -> None:
     """Update queue depth metrics."""
     try:
-        from app.config import settings
-        import redis
-        
-        client = redis.from_url(settings.REDIS_URL)
-        
-        for queue_name in [
+        queue_names = [
             settings.DEFAULT_QUEUE_NAME,
             settings.HIGH_PRIORITY_QUEUE_NAME,
             settings.LOW_PRIORITY_QUEUE_NAME
-        ]:
-            depth = client.llen(queue_name)
-            update_queue_depth(queue_name, depth)
+        ]
         
-        client.close()
+        # One round-trip for all queues
+        pipe = _REDIS.pipeline(transaction=False)
+        for queue_name in queue_names:
+            pipe.llen(queue_name)
+        depths = pipe.execute()
+        
+        for queue_name, depth in zip(queue_names, depths):
+            update_queue_depth(queue_name, depth)
     except Exception as e:
         logger.error("Failed to update queue metrics", error=str(e))
+
+
+@celery_app.task(name="app.celery_app.tasks.dispatch_outbox")
+def dispatch_outbox() -> int:
+    """Publish job tasks whose outbox events were never cleared.
+    
+    The API deletes a job's outbox event right after queueing its task, so
+    an event older than OUTBOX_DISPATCH_DELAY_SECONDS means the API stopped
+    between committing the job and publishing it.
+    
+    Returns:
+        Number of tasks published
+    """
+    async def dispatch(db: Prisma) -> int:
+        cutoff = datetime.utcnow() - timedelta(seconds=settings.OUTBOX_DISPATCH_DELAY_SECONDS)
+        events = await get_pending_outbox_events(db=db, created_before=cutoff)
+        
+        for event in events:
+            # Publishing blocks on the broker; keep it off the shared loop so
+            # a slow broker does not stall other coroutines running on it
+            await asyncio.to_thread(
+                process_video_generation.apply_async,
+                args=[event.jobId],
+                task_id=event.taskId
+            )
+            await delete_outbox_event(db=db, task_id=event.taskId)
+            logger.warning(
+                "Dispatched job from outbox",
+                job_id=event.jobId,
+                task_id=event.taskId
+            )
+        
+        return len(events)
+    
+    try:
+        return run_async(dispatch(_get_worker_db()))
+    except Exception as e:
+        logger.error("Failed to dispatch outbox", error=str(e))
+        return 0
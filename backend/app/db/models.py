@@ -1,14 +1,120 @@
 """Database model helpers."""
+import itertools
+import json
+import os
+import secrets
+import socket
+import time
 from typing import Any, Dict, List, Optional
 from datetime import datetime
 
-from prisma.models import Job, ProviderHealth, Metric, User, Project
+from prisma.models import Job, ProviderHealth, Metric, User, Project, OutboxEvent
 
+from app.db.redis import get_redis
+from app.monitoring.health_cache import invalidate_healthy_providers
 from app.utils.errors import DatabaseError
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+JOB_STATS_CACHE_TTL_SECONDS = 5
+PROVIDER_HEALTH_CACHE_TTL_SECONDS = 10
+# Outlives any realistic queue wait plus retry backoff for a task
+CANCELLED_TASK_MARKER_TTL_SECONDS = 86400
+
+_PROVIDER_HEALTH_CACHE_KEY = "providers:health"
+
+
+_BASE36_DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+_CUID_BLOCK_SIZE = 4
+_cuid_counter = itertools.count()
+
+
+def _base36(value: int, width: int) -> str:
+    """Encode a non-negative integer in base 36, keeping the last width digits."""
+    digits = ""
+    while value:
+        value, remainder = divmod(value, 36)
+        digits = _BASE36_DIGITS[remainder] + digits
+    return digits.rjust(width, "0")[-width:]
+
+
+def _cuid_fingerprint() -> str:
+    """Build the process fingerprint block of a cuid."""
+    hostname = socket.gethostname()
+    host_id = sum(ord(char) for char in hostname) + len(hostname) + 36
+    return _base36(os.getpid(), 2) + _base36(host_id, 2)
+
+
+def _generate_cuid() -> str:
+    """Generate an id in the cuid format of the schema's ``@default(cuid())``.
+
+    Raw INSERTs bypass Prisma's id generation, so they use this to keep ids
+    in one format per table.
+
+    Returns:
+        25 character cuid
+    """
+    block_max = 36 ** _CUID_BLOCK_SIZE
+    return (
+        "c"
+        + _base36(int(time.time() * 1000), 8)
+        + _base36(next(_cuid_counter) % block_max, _CUID_BLOCK_SIZE)
+        + _cuid_fingerprint()
+        + _base36(secrets.randbelow(block_max), _CUID_BLOCK_SIZE)
+        + _base36(secrets.randbelow(block_max), _CUID_BLOCK_SIZE)
+    )
+
+
+def _job_stats_cache_key(user_id: str) -> str:
+    """Build the Redis key for a user's cached job statistics."""
+    return f"stats:{user_id}"
+
+
+async def invalidate_job_stats(user_id: str) -> None:
+    """Drop a user's cached job statistics.
+    
+    Cache failures are logged and swallowed; the entry expires on its own.
+    
+    Args:
+        user_id: User ID
+    """
+    try:
+        await get_redis().delete(_job_stats_cache_key(user_id))
+    except Exception as e:
+        logger.warning("Failed to invalidate job stats cache", user_id=user_id, error=str(e))
+
+
+def cancelled_task_key(task_id: str) -> str:
+    """Build the Redis key marking a job's Celery task as cancelled.
+    
+    Keyed by task rather than job so a retry, which gets a new task ID,
+    is unaffected by an earlier cancellation.
+    """
+    return f"cancelled_task:{task_id}"
+
+
+async def mark_tasks_cancelled(task_ids: List[Optional[str]]) -> None:
+    """Flag Celery tasks so workers skip them without querying the database.
+    
+    Cache failures are logged and swallowed; workers then fall back to the
+    database.
+    
+    Args:
+        task_ids: Celery task IDs (None entries are ignored)
+    """
+    task_ids = [task_id for task_id in task_ids if task_id]
+    if not task_ids:
+        return
+    
+    try:
+        pipe = get_redis().pipeline(transaction=False)
+        for task_id in task_ids:
+            pipe.set(cancelled_task_key(task_id), 1, ex=CANCELLED_TASK_MARKER_TTL_SECONDS)
+        await pipe.execute()
+    except Exception as e:
+        logger.warning("Failed to mark tasks cancelled", count=len(task_ids), error=str(e))
+
 
 async def get_system_metadata(db: Any, key: str) -> Optional[Any]:
     """Get system metadata by key.
@@ -34,7 +140,8 @@ async def create_job(
     prompt: str,
     project_id: Optional[str] = None,
     metadata: Optional[Dict[str, Any]] = None,
-    max_retries: Optional[int] = None
+    max_retries: Optional[int] = None,
+    celery_task_id: Optional[str] = None
 ) -> Job:
     """Create a new job.
     
@@ -45,6 +152,9 @@ async def create_job(
         project_id: Project ID (optional)
         metadata: Additional metadata
         max_retries: Maximum retry attempts (overrides system default)
+        celery_task_id: Pre-assigned Celery task ID (optional). An outbox
+            event for it is written with the job so the task is still
+            published if the caller never gets to queue it.
         
     Returns:
         Created job
@@ -66,9 +176,14 @@ async def create_job(
         
         if project_id:
             job_data["projectId"] = project_id
+        if celery_task_id:
+            job_data["celeryTaskId"] = celery_task_id
+            # Nested write: the job and its outbox event commit together
+            job_data["outboxEvents"] = {"create": {"taskId": celery_task_id}}
             
         job = await db.job.create(data=job_data)
         logger.info("Job created", job_id=job.id, user_id=user_id, project_id=project_id)
+        await invalidate_job_stats(user_id)
         return job
     except Exception as e:
         logger.error("Failed to create job", error=str(e))
@@ -92,6 +207,28 @@ async def get_job(db: Any, job_id: str) -> Optional[Job]:
         raise DatabaseError(f"Failed to get job: {str(e)}")
 
 
+async def get_job_access_info(db: Any, job_id: str) -> Optional[Dict[str, Any]]:
+    """Get only the job columns needed for ownership and status checks.
+    
+    Skips the prompt, metadata and result columns, which can be large.
+    
+    Args:
+        db: Prisma client
+        job_id: Job ID
+        
+    Returns:
+        Dict with id, userId, status and celeryTaskId, or None if not found
+    """
+    try:
+        return await db.query_first(
+            'SELECT "id", "userId", "status", "celeryTaskId" FROM "jobs" WHERE "id" = $1',
+            job_id
+        )
+    except Exception as e:
+        logger.error("Failed to get job access info", job_id=job_id, error=str(e))
+        raise DatabaseError(f"Failed to get job: {str(e)}")
+
+
 async def list_jobs(
     db: Any,
     user_id: Optional[str] = None,
@@ -186,12 +323,245 @@ async def update_job_status(
             data=data
         )
         logger.info("Job status updated", job_id=job_id, status=status)
+        if job:
+            await invalidate_job_stats(job.userId)
         return job
     except Exception as e:
         logger.error("Failed to update job status", job_id=job_id, error=str(e))
         raise DatabaseError(f"Failed to update job status: {str(e)}")
 
 
+async def start_job(db: Any, job_id: str, lease_seconds: int) -> Optional[Job]:
+    """Claim a queued job for processing in a single conditional UPDATE.
+    
+    The claim is exclusive: a job already in processing is only re-claimed
+    once its lease has expired, i.e. when the run that claimed it must have
+    died (tasks cannot outlive the Celery hard time limit). Duplicate
+    deliveries of a running job therefore never start a second run.
+    
+    Args:
+        db: Prisma client
+        job_id: Job ID
+        lease_seconds: Age after which a processing job is considered abandoned
+        
+    Returns:
+        Claimed job, or None if the job does not exist, is being processed
+        by a live run or has already completed, failed or been cancelled
+        
+    Raises:
+        DatabaseError: If update fails
+    """
+    try:
+        job = await db.query_first(
+            """
+            UPDATE "jobs"
+            SET "status" = 'processing',
+                "startedAt" = (now() AT TIME ZONE 'UTC'),
+                "updatedAt" = (now() AT TIME ZONE 'UTC')
+            WHERE "id" = $1
+              AND (
+                "status" = 'queued'
+                OR (
+                  "status" = 'processing'
+                  AND "updatedAt" < (now() AT TIME ZONE 'UTC') - make_interval(secs => $2::int)
+                )
+              )
+            RETURNING *
+            """,
+            job_id,
+            lease_seconds,
+            model=Job
+        )
+        if job:
+            logger.info("Job status updated", job_id=job_id, status="processing")
+            await invalidate_job_stats(job.userId)
+        return job
+    except Exception as e:
+        logger.error("Failed to start job", job_id=job_id, error=str(e))
+        raise DatabaseError(f"Failed to start job: {str(e)}")
+
+
+async def release_job(db: Any, job_id: str) -> None:
+    """Return a claimed job to the queue before its task is retried.
+    
+    Only a job still in processing is released, so a job cancelled or
+    finished in the meantime keeps its status.
+    
+    Args:
+        db: Prisma client
+        job_id: Job ID
+        
+    Raises:
+        DatabaseError: If update fails
+    """
+    try:
+        job = await db.query_first(
+            """
+            UPDATE "jobs"
+            SET "status" = 'queued',
+                "startedAt" = NULL,
+                "updatedAt" = (now() AT TIME ZONE 'UTC')
+            WHERE "id" = $1
+              AND "status" = 'processing'
+            RETURNING "userId"
+            """,
+            job_id
+        )
+        if job:
+            logger.info("Job status updated", job_id=job_id, status="queued")
+            await invalidate_job_stats(job["userId"])
+    except Exception as e:
+        logger.error("Failed to release job", job_id=job_id, error=str(e))
+        raise DatabaseError(f"Failed to release job: {str(e)}")
+
+
+async def cancel_job(db: Any, job_id: str, user_id: str) -> Optional[Job]:
+    """Cancel a user's queued or processing job in a single conditional UPDATE.
+    
+    Args:
+        db: Prisma client
+        job_id: Job ID
+        user_id: ID of the user who must own the job
+        
+    Returns:
+        Cancelled job, or None if the job does not exist, belongs to another
+        user or has already finished
+        
+    Raises:
+        DatabaseError: If update fails
+    """
+    try:
+        job = await db.query_first(
+            """
+            UPDATE "jobs"
+            SET "status" = 'cancelled',
+                "errorMessage" = $3,
+                "updatedAt" = (now() AT TIME ZONE 'UTC')
+            WHERE "id" = $1
+              AND "userId" = $2
+              AND "status" NOT IN ('completed', 'failed', 'cancelled')
+            RETURNING *
+            """,
+            job_id,
+            user_id,
+            "Job cancelled by user",
+            model=Job
+        )
+        if job:
+            logger.info("Job status updated", job_id=job_id, status="cancelled")
+            await mark_tasks_cancelled([job.celeryTaskId])
+            await invalidate_job_stats(user_id)
+        return job
+    except Exception as e:
+        logger.error("Failed to cancel job", job_id=job_id, error=str(e))
+        raise DatabaseError(f"Failed to cancel job: {str(e)}")
+
+
+async def cancel_jobs(db: Any, job_ids: List[str], user_id: str) -> List[Dict[str, Any]]:
+    """Cancel a user's queued or processing jobs in a single conditional UPDATE.
+    
+    Jobs that do not exist, belong to another user or have already finished
+    are skipped.
+    
+    Args:
+        db: Prisma client
+        job_ids: Job IDs
+        user_id: ID of the user who must own the jobs
+        
+    Returns:
+        Dicts with id, celeryTaskId and startedAt of each cancelled job
+        
+    Raises:
+        DatabaseError: If update fails
+    """
+    try:
+        jobs = await db.query_raw(
+            """
+            UPDATE "jobs"
+            SET "status" = 'cancelled',
+                "errorMessage" = $3,
+                "updatedAt" = (now() AT TIME ZONE 'UTC')
+            WHERE "id" = ANY($1)
+              AND "userId" = $2
+              AND "status" NOT IN ('completed', 'failed', 'cancelled')
+            RETURNING "id", "celeryTaskId", "startedAt"
+            """,
+            job_ids,
+            user_id,
+            "Job cancelled by user"
+        )
+        if jobs:
+            logger.info("Jobs cancelled", count=len(jobs), user_id=user_id)
+            await mark_tasks_cancelled([job["celeryTaskId"] for job in jobs])
+            await invalidate_job_stats(user_id)
+        return jobs
+    except Exception as e:
+        logger.error("Failed to cancel jobs", user_id=user_id, error=str(e))
+        raise DatabaseError(f"Failed to cancel jobs: {str(e)}")
+
+
+async def requeue_job(
+    db: Any,
+    job_id: str,
+    user_id: str,
+    celery_task_id: str
+) -> Optional[Job]:
+    """Requeue a user's failed or cancelled job in a single conditional UPDATE.
+    
+    The retry count, error message, start and completion times of the
+    previous attempt are reset, and the outbox event for the new task is inserted
+    by the same statement.
+    
+    Args:
+        db: Prisma client
+        job_id: Job ID
+        user_id: ID of the user who must own the job
+        celery_task_id: Celery task ID of the new attempt
+        
+    Returns:
+        Requeued job, or None if the job does not exist, belongs to another
+        user or is not failed or cancelled
+        
+    Raises:
+        DatabaseError: If update fails
+    """
+    try:
+        job = await db.query_first(
+            """
+            WITH requeued AS (
+                UPDATE "jobs"
+                SET "status" = 'queued',
+                    "celeryTaskId" = $3,
+                    "retryCount" = 0,
+                    "errorMessage" = NULL,
+                    "startedAt" = NULL,
+                    "completedAt" = NULL,
+                    "updatedAt" = (now() AT TIME ZONE 'UTC')
+                WHERE "id" = $1
+                  AND "userId" = $2
+                  AND "status" IN ('failed', 'cancelled')
+                RETURNING *
+            ), outbox AS (
+                INSERT INTO "outbox_events" ("id", "jobId", "taskId", "createdAt")
+                SELECT $4, "id", $3, (now() AT TIME ZONE 'UTC') FROM requeued
+            )
+            SELECT * FROM requeued
+            """,
+            job_id,
+            user_id,
+            celery_task_id,
+            _generate_cuid(),
+            model=Job
+        )
+        if job:
+            logger.info("Job status updated", job_id=job_id, status="queued")
+            await invalidate_job_stats(user_id)
+        return job
+    except Exception as e:
+        logger.error("Failed to requeue job", job_id=job_id, error=str(e))
+        raise DatabaseError(f"Failed to requeue job: {str(e)}")
+
+
 async def delete_job(db: Any, job_id: str) -> None:
     """Delete job by ID.
     
@@ -203,16 +573,98 @@ async def delete_job(db: Any, job_id: str) -> None:
         DatabaseError: If deletion fails
     """
     try:
-        await db.job.delete(where={"id": job_id})
+        job = await db.job.delete(where={"id": job_id})
         logger.info("Job deleted", job_id=job_id)
+        if job:
+            await invalidate_job_stats(job.userId)
     except Exception as e:
         logger.error("Failed to delete job", job_id=job_id, error=str(e))
         raise DatabaseError(f"Failed to delete job: {str(e)}")
 
 
+async def delete_owned_job(db: Any, job_id: str, user_id: str) -> Optional[Dict[str, Any]]:
+    """Delete a user's job in a single conditional DELETE.
+    
+    Args:
+        db: Prisma client
+        job_id: Job ID
+        user_id: ID of the user who must own the job
+        
+    Returns:
+        Dict with the deleted job's id and celeryTaskId, or None if the job
+        does not exist or belongs to another user
+        
+    Raises:
+        DatabaseError: If deletion fails
+    """
+    try:
+        job = await db.query_first(
+            'DELETE FROM "jobs" WHERE "id" = $1 AND "userId" = $2 RETURNING "id", "celeryTaskId"',
+            job_id,
+            user_id
+        )
+        if job:
+            logger.info("Job deleted", job_id=job_id)
+            await mark_tasks_cancelled([job["celeryTaskId"]])
+            await invalidate_job_stats(user_id)
+        return job
+    except Exception as e:
+        logger.error("Failed to delete job", job_id=job_id, error=str(e))
+        raise DatabaseError(f"Failed to delete job: {str(e)}")
+
+
+async def delete_outbox_event(db: Any, task_id: str) -> None:
+    """Delete the outbox event for a task once it has been published.
+    
+    Args:
+        db: Prisma client
+        task_id: Celery task ID
+        
+    Raises:
+        DatabaseError: If deletion fails
+    """
+    try:
+        await db.outboxevent.delete_many(where={"taskId": task_id})
+    except Exception as e:
+        logger.error("Failed to delete outbox event", task_id=task_id, error=str(e))
+        raise DatabaseError(f"Failed to delete outbox event: {str(e)}")
+
+
+async def get_pending_outbox_events(
+    db: Any,
+    created_before: datetime,
+    limit: int = 100
+) -> List[OutboxEvent]:
+    """Get outbox events that were never cleared after publishing.
+    
+    Args:
+        db: Prisma client
+        created_before: Only return events older than this (UTC)
+        limit: Maximum number of events to return
+        
+    Returns:
+        Pending outbox events, oldest first
+        
+    Raises:
+        DatabaseError: If query fails
+    """
+    try:
+        return await db.outboxevent.find_many(
+            where={"createdAt": {"lt": created_before}},
+            order={"createdAt": "asc"},
+            take=limit
+        )
+    except Exception as e:
+        logger.error("Failed to get pending outbox events", error=str(e))
+        raise DatabaseError(f"Failed to get pending outbox events: {str(e)}")
+
+
 async def get_job_stats(db: Any, user_id: Optional[str] = None) -> Dict[str, Any]:
     """Get job statistics.
     
+    Per-user statistics are cached in Redis for JOB_STATS_CACHE_TTL_SECONDS
+    and invalidated whenever one of the user's jobs is written.
+    
     Args:
         db: Prisma client
         user_id: Filter by user ID
@@ -220,32 +672,41 @@ async def get_job_stats(db: Any, user_id: Optional[str] = None) -> Dict[str, Any
     Returns:
         Job statistics
     """
+    if user_id:
+        try:
+            cached = await get_redis().get(_job_stats_cache_key(user_id))
+            if cached:
+                return json.loads(cached)
+        except Exception as e:
+            logger.warning("Failed to read job stats cache", user_id=user_id, error=str(e))
+    
     try:
         where: Dict[str, Any] = {}
         if user_id:
             where["userId"] = user_id
             
-        total = await db.job.count(where=where)
+        # One GROUP BY for every status count and the completed-job average
+        rows = await db.job.group_by(
+            by=["status"],
+            where=where,
+            count=True,
+            avg={"generationTimeMs": True}
+        )
+        
+        by_status = {status: 0 for status in ["queued", "processing", "completed", "failed", "cancelled"]}
+        avg_gen_time = 0
+        for row in rows:
+            by_status[row["status"]] = row["_count"]["_all"]
+            if row["status"] == "completed":
+                avg_gen_time = row["_avg"]["generationTimeMs"] or 0
+        
+        total = sum(by_status.values())
         
-        statuses = ["queued", "processing", "completed", "failed", "cancelled"]
-        by_status = {}
-        for status in statuses:
-            where_status = {**where, "status": status}
-            by_status[status] = await db.job.count(where=where_status)
-            
         completed = by_status.get("completed", 0)
         failed = by_status.get("failed", 0)
         success_rate = (completed / (completed + failed)) if (completed + failed) > 0 else 0
-        
-        # Average generation time for completed jobs
-        avg_gen_time = 0
-        completed_jobs = await db.job.find_many(
-            where={**where, "status": "completed", "generationTimeMs": {"not": None}},
-        )
-        if completed_jobs:
-            avg_gen_time = sum(j.generationTimeMs for j in completed_jobs if j.generationTimeMs) / len(completed_jobs)
             
-        return {
+        stats = {
             "total": total,
             "by_status": by_status,
             "success_rate": success_rate,
@@ -254,6 +715,18 @@ async def get_job_stats(db: Any, user_id: Optional[str] = None) -> Dict[str, Any
     except Exception as e:
         logger.error("Failed to get job stats", error=str(e))
         raise DatabaseError(f"Failed to get job stats: {str(e)}")
+    
+    if user_id:
+        try:
+            await get_redis().set(
+                _job_stats_cache_key(user_id),
+                json.dumps(stats),
+                ex=JOB_STATS_CACHE_TTL_SECONDS
+            )
+        except Exception as e:
+            logger.warning("Failed to write job stats cache", user_id=user_id, error=str(e))
+    
+    return stats
 
 
 async def update_provider_health(
@@ -267,6 +740,10 @@ async def update_provider_health(
 ) -> ProviderHealth:
     """Update provider health status.
     
+    Inserts or updates the provider's row in a single statement; the
+    consecutive failure count is incremented in the database, so
+    concurrent checks cannot lose an increment.
+    
     Args:
         db: Prisma client
         provider: Provider name
@@ -280,48 +757,63 @@ async def update_provider_health(
         Updated provider health
     """
     try:
-        existing = await db.providerhealth.find_unique(where={"provider": provider})
-        
-        consecutive_failures = 0
-        if existing:
-            consecutive_failures = existing.consecutiveFailures + 1 if status == "unhealthy" else 0
-        
-        data: Dict[str, Any] = {
-            "status": status,
-            "lastCheckedAt": datetime.utcnow(),
-            "consecutiveFailures": consecutive_failures,
-        }
-        
-        if error_message:
-            data["lastErrorMessage"] = error_message
-        if response_time_ms:
-            data["avgResponseTimeMs"] = response_time_ms
-        if cost_per_request:
-            data["costPerRequest"] = cost_per_request
-        if metadata:
-            data["metadata"] = metadata
-        
-        health = await db.providerhealth.upsert(
-            where={"provider": provider},
-            data={
-                "create": {
-                    "provider": provider,
-                    **data
-                },
-                "update": data
-            }
+        health = await db.query_first(
+            """
+            INSERT INTO "provider_health" AS ph (
+                "id", "provider", "status", "lastCheckedAt", "lastErrorMessage",
+                "consecutiveFailures", "avgResponseTimeMs", "costPerRequest",
+                "metadata", "updatedAt"
+            )
+            VALUES (
+                $1, $2, $3, (now() AT TIME ZONE 'UTC'), $4,
+                0, $5::int, $6::double precision,
+                $7::jsonb, (now() AT TIME ZONE 'UTC')
+            )
+            ON CONFLICT ("provider") DO UPDATE SET
+                "status" = EXCLUDED."status",
+                "lastCheckedAt" = EXCLUDED."lastCheckedAt",
+                "lastErrorMessage" = COALESCE(EXCLUDED."lastErrorMessage", ph."lastErrorMessage"),
+                "consecutiveFailures" = CASE
+                    WHEN EXCLUDED."status" = 'unhealthy' THEN ph."consecutiveFailures" + 1
+                    ELSE 0
+                END,
+                "avgResponseTimeMs" = COALESCE(EXCLUDED."avgResponseTimeMs", ph."avgResponseTimeMs"),
+                "costPerRequest" = COALESCE(EXCLUDED."costPerRequest", ph."costPerRequest"),
+                "metadata" = COALESCE(EXCLUDED."metadata", ph."metadata"),
+                "updatedAt" = EXCLUDED."updatedAt"
+            RETURNING *
+            """,
+            _generate_cuid(),
+            provider,
+            status,
+            error_message or None,
+            response_time_ms or None,
+            cost_per_request or None,
+            json.dumps(metadata) if metadata else None,
+            model=ProviderHealth
         )
         
         logger.info("Provider health updated", provider=provider, status=status)
-        return health
     except Exception as e:
         logger.error("Failed to update provider health", provider=provider, error=str(e))
         raise DatabaseError(f"Failed to update provider health: {str(e)}")
+    
+    invalidate_healthy_providers()
+    try:
+        await get_redis().delete(_PROVIDER_HEALTH_CACHE_KEY)
+    except Exception as e:
+        logger.warning("Failed to invalidate provider health cache", error=str(e))
+    
+    return health
 
 
 async def get_provider_health(db: Any, provider: Optional[str] = None) -> List[ProviderHealth]:
     """Get provider health status.
     
+    The full provider list is cached in Redis for
+    PROVIDER_HEALTH_CACHE_TTL_SECONDS and invalidated by
+    update_provider_health.
+    
     Args:
         db: Prisma client
         provider: Specific provider name (optional)
@@ -329,15 +821,33 @@ async def get_provider_health(db: Any, provider: Optional[str] = None) -> List[P
     Returns:
         List of provider health records
     """
+    if not provider:
+        try:
+            cached = await get_redis().get(_PROVIDER_HEALTH_CACHE_KEY)
+            if cached:
+                return [ProviderHealth.model_validate(item) for item in json.loads(cached)]
+        except Exception as e:
+            logger.warning("Failed to read provider health cache", error=str(e))
+    
     try:
         if provider:
             health = await db.providerhealth.find_unique(where={"provider": provider})
             return [health] if health else []
-        else:
-            return await db.providerhealth.find_many()
+        providers = await db.providerhealth.find_many()
     except Exception as e:
         logger.error("Failed to get provider health", error=str(e))
         raise DatabaseError(f"Failed to get provider health: {str(e)}")
+    
+    try:
+        await get_redis().set(
+            _PROVIDER_HEALTH_CACHE_KEY,
+            json.dumps([p.model_dump(mode="json") for p in providers]),
+            ex=PROVIDER_HEALTH_CACHE_TTL_SECONDS
+        )
+    except Exception as e:
+        logger.warning("Failed to write provider health cache", error=str(e))
+    
+    return providers
 
 
 async def create_metric(
@@ -443,6 +953,50 @@ async def list_user_projects(
         raise DatabaseError(f"Failed to list projects: {str(e)}")
 
 
+async def update_owned_project(
+    db: Any,
+    project_id: str,
+    user_id: str,
+    name: Optional[str] = None,
+    description: Optional[str] = None
+) -> Optional[Project]:
+    """Update a user's project in a single conditional UPDATE.
+    
+    Args:
+        db: Prisma client
+        project_id: Project ID
+        user_id: ID of the user who must own the project
+        name: New name (unchanged if None)
+        description: New description (unchanged if None)
+        
+    Returns:
+        Updated project, or None if the project does not exist or belongs
+        to another user
+        
+    Raises:
+        DatabaseError: If update fails
+    """
+    try:
+        return await db.query_first(
+            """
+            UPDATE "projects"
+            SET "name" = COALESCE($3, "name"),
+                "description" = COALESCE($4, "description"),
+                "updatedAt" = (now() AT TIME ZONE 'UTC')
+            WHERE "id" = $1 AND "userId" = $2
+            RETURNING *
+            """,
+            project_id,
+            user_id,
+            name,
+            description,
+            model=Project
+        )
+    except Exception as e:
+        logger.error("Failed to update project", project_id=project_id, error=str(e))
+        raise DatabaseError(f"Failed to update project: {str(e)}")
+
+
 async def get_project(db: Any, project_id: str) -> Optional[Project]:
     """Get project by ID.
     
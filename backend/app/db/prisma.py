@@ -1,35 +1,52 @@
 """Prisma database client."""
-from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 from prisma import Prisma
 
+from app.config import settings
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-prisma_client: Optional[Prisma] = None
+
+def get_datasource_url() -> str:
+    """Build the database URL with connection pool parameters.
+
+    Explicit ``connection_limit``/``pool_timeout`` values already present in
+    DATABASE_URL take precedence over the configured defaults. When the URL
+    points at PgBouncer in transaction mode, set DATABASE_PGBOUNCER so the
+    query engine stops relying on prepared statements.
+
+    Returns:
+        Database URL for the Prisma query engine
+    """
+    parts = urlsplit(settings.DATABASE_URL)
+    query = dict(parse_qsl(parts.query))
+    query.setdefault("connection_limit", str(settings.DATABASE_CONNECTION_LIMIT))
+    query.setdefault("pool_timeout", str(settings.DATABASE_POOL_TIMEOUT))
+    if settings.DATABASE_PGBOUNCER:
+        query.setdefault("pgbouncer", "true")
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+# Process-wide client; the API connects it once in the application lifespan
+prisma = Prisma(datasource={"url": get_datasource_url()})
 
 
 async def get_prisma() -> Prisma:
-    """Get Prisma client instance.
+    """Get the shared Prisma client, connecting it on first use.
     
     Returns:
         Prisma client instance
     """
-    global prisma_client
-    
-    if prisma_client is None:
-        prisma_client = Prisma()
-        await prisma_client.connect()
+    if not prisma.is_connected():
+        await prisma.connect()
         logger.info("Prisma client connected")
     
-    return prisma_client
+    return prisma
 
 
 async def disconnect_prisma() -> None:
     """Disconnect Prisma client."""
-    global prisma_client
-    
-    if prisma_client is not None:
-        await prisma_client.disconnect()
-        prisma_client = None
+    if prisma.is_connected():
+        await prisma.disconnect()
         logger.info("Prisma client disconnected")
@@ -0,0 +1,31 @@
+"""Redis client."""
+import asyncio
+from typing import Optional
+
+from redis import asyncio as aioredis
+
+from app.config import settings
+
+_redis_client: Optional[aioredis.Redis] = None
+_redis_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_redis() -> aioredis.Redis:
+    """Get the asyncio Redis client for the running event loop.
+
+    asyncio connections belong to the loop that opened them, so the client
+    is rebuilt whenever the running loop changes: in practice once per
+    Celery worker process (on its persistent loop) and once for the API
+    loop.
+
+    Returns:
+        Redis client instance
+    """
+    global _redis_client, _redis_loop
+
+    loop = asyncio.get_running_loop()
+    if _redis_client is None or _redis_loop is not loop:
+        _redis_client = aioredis.from_url(settings.REDIS_URL)
+        _redis_loop = loop
+
+    return _redis_client
@@ -3,6 +3,7 @@ from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import settings
@@ -11,7 +12,7 @@ from app.db.metadata import load_metadata
 from app.api.routes import jobs, health, providers, metadata, auth, projects
 from app.api.middleware.error_handler import ErrorHandlerMiddleware
 from app.api.middleware.request_validation import RequestValidationMiddleware
-from app.utils.logger import get_logger
+from app.utils.logger import get_logger, start_queue_logging, stop_queue_logging
 
 logger = get_logger(__name__)
 
@@ -26,9 +27,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     Yields:
         None
     """
+    start_queue_logging()
     logger.info("Starting application", app_name=settings.APP_NAME, env=settings.APP_ENV)
     
-    await get_prisma()
+    app.state.prisma = await get_prisma()
     logger.info("Database connected")
     
     # Load metadata
@@ -39,13 +41,15 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     
     await disconnect_prisma()
     logger.info("Application shutdown complete")
+    stop_queue_logging()
 
 
 app = FastAPI(
     title="AI Video Generation Backend",
     description="Production-ready backend for AI video generation platform",
     version="0.1.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 app.state.config = settings
@@ -59,7 +63,11 @@ app.add_middleware(
 )
 
 app.add_middleware(ErrorHandlerMiddleware)
-app.add_middleware(RequestValidationMiddleware)
+
+# API key validation only applies in production; skip the middleware entirely
+# elsewhere so it does not sit on the request path.
+if settings.APP_ENV == "production":
+    app.add_middleware(RequestValidationMiddleware)
 
 app.include_router(health.router)
 app.include_router(auth.router, prefix=f"/api/{settings.API_VERSION}")
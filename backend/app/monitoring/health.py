@@ -5,7 +5,7 @@ import time
 from app.db.prisma import get_prisma
 from app.config import settings
 from app.utils.logger import get_logger
-import redis
+from redis import asyncio as aioredis
 
 logger = get_logger(__name__)
 
@@ -32,11 +32,13 @@ async def check_redis_health() -> Dict[str, Any]:
         Health status dict
     """
     try:
-        client = redis.from_url(settings.REDIS_URL)
-        start = time.time()
-        client.ping()
-        latency_ms = (time.time() - start) * 1000
-        client.close()
+        client = aioredis.from_url(settings.REDIS_URL)
+        try:
+            start = time.time()
+            await client.ping()
+            latency_ms = (time.time() - start) * 1000
+        finally:
+            await client.aclose()
         return {"status": "healthy", "latency_ms": round(latency_ms, 2)}
     except Exception as e:
         logger.error("Redis health check failed", error=str(e))
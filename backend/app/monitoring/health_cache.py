@@ -0,0 +1,123 @@
+"""In-process cache of healthy providers for the task hot path."""
+import asyncio
+import threading
+import time
+from typing import Any, List, Optional, Tuple
+
+from prisma.models import ProviderHealth
+
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+HEALTHY_PROVIDERS_CACHE_TTL_SECONDS = 5.0
+# Past the TTL the cached list is still served while a refresh runs in the
+# background, up to this age
+HEALTHY_PROVIDERS_MAX_STALE_SECONDS = 60.0
+
+# (loaded_at, version, providers); version guards against storing a list
+# that was read before an invalidation
+_cache: Optional[Tuple[float, int, List[ProviderHealth]]] = None
+_version = 0
+_refreshing = False
+# Strong reference so the running refresh task is not garbage collected
+_refresh_task: Optional["asyncio.Task[None]"] = None
+_lock = threading.Lock()
+
+
+def invalidate_healthy_providers() -> None:
+    """Force the next lookup in this process to reload from the database."""
+    global _cache, _version
+
+    with _lock:
+        _version += 1
+        _cache = None
+
+
+async def _load_healthy_providers(db: Any) -> List[ProviderHealth]:
+    """Read healthy providers and store them unless invalidated meanwhile.
+
+    Args:
+        db: Prisma client
+
+    Returns:
+        Providers whose status is healthy
+    """
+    global _cache
+
+    with _lock:
+        version = _version
+
+    loaded_at = time.monotonic()
+    # Stable order so round-robin selection rotates predictably
+    providers = await db.providerhealth.find_many(
+        where={"status": "healthy"},
+        order={"provider": "asc"}
+    )
+
+    with _lock:
+        if _version == version:
+            _cache = (loaded_at, version, providers)
+
+    logger.debug("Reloaded healthy providers", count=len(providers))
+    return providers
+
+
+async def _refresh_in_background(db: Any) -> None:
+    """Reload the cache, logging instead of raising on failure.
+
+    Args:
+        db: Prisma client
+    """
+    global _refreshing
+
+    try:
+        await _load_healthy_providers(db)
+    except Exception as e:
+        logger.warning("Failed to refresh healthy providers", error=str(e))
+    finally:
+        with _lock:
+            _refreshing = False
+
+
+async def get_healthy_providers_cached(
+    db: Any,
+    ttl: float = HEALTHY_PROVIDERS_CACHE_TTL_SECONDS,
+    max_stale: float = HEALTHY_PROVIDERS_MAX_STALE_SECONDS
+) -> List[ProviderHealth]:
+    """Get healthy providers, reusing this process's copy where possible.
+
+    A copy younger than ``ttl`` is returned as is. An older copy, up to
+    ``max_stale``, is returned immediately while a single background refresh
+    reloads it (stale-while-revalidate). Only a missing or expired copy makes
+    the caller wait for the database. Health changes written by other
+    processes become visible once the cached copy is refreshed.
+
+    Args:
+        db: Prisma client
+        ttl: Age in seconds after which the cached list is refreshed
+        max_stale: Age in seconds after which the cached list is not served
+
+    Returns:
+        Providers whose status is healthy
+    """
+    global _refreshing, _refresh_task
+
+    with _lock:
+        cached = _cache
+
+    if cached is not None:
+        age = time.monotonic() - cached[0]
+        if age < ttl:
+            return cached[2]
+        if age < max_stale:
+            with _lock:
+                start_refresh = not _refreshing
+                _refreshing = True
+            if start_refresh:
+                _refresh_task = asyncio.get_running_loop().create_task(
+                    _refresh_in_background(db)
+                )
+            return cached[2]
+
+    return await _load_healthy_providers(db)
@@ -1,13 +1,58 @@
 """Structured logging configuration."""
 import logging
+import queue
 import sys
-from typing import Any, Dict
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, List, Optional, Union
 import json
 from datetime import datetime
 
 from app.config import settings
 
 
+class _JSONRecordFormatter(logging.Formatter):
+    """Emit the pre-built JSON message, folding any traceback into it.
+
+    The stock formatter appends tracebacks as extra lines, which would
+    break one-JSON-object-per-line log ingestion.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format a record as a single line.
+
+        Args:
+            record: Log record whose message is a JSON object
+
+        Returns:
+            JSON string, with a ``traceback`` field if exc_info was set
+        """
+        message = record.getMessage()
+        if not record.exc_info:
+            return message
+
+        try:
+            log_data = json.loads(message)
+        except ValueError:
+            log_data = {"message": message}
+        log_data["traceback"] = self.formatException(record.exc_info)
+        return json.dumps(log_data)
+
+
+# Shared stdout handler. While queue logging is active, loggers write to
+# _queue_handler instead and _queue_listener feeds this handler from a
+# background thread.
+_stream_handler = logging.StreamHandler(sys.stdout)
+_stream_handler.setFormatter(_JSONRecordFormatter())
+
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_queue_handler = QueueHandler(_log_queue)
+# QueueHandler formats records before enqueueing them, so it needs the same
+# formatter to keep tracebacks inside the JSON object
+_queue_handler.setFormatter(_JSONRecordFormatter())
+_queue_listener: Optional[QueueListener] = None
+_loggers: List[logging.Logger] = []
+
+
 class StructuredLogger:
     """Structured logger with JSON output."""
     
@@ -21,9 +66,10 @@ class StructuredLogger:
         self.logger.setLevel(getattr(logging, settings.LOG_LEVEL))
         
         if not self.logger.handlers:
-            handler = logging.StreamHandler(sys.stdout)
-            handler.setFormatter(logging.Formatter('%(message)s'))
-            self.logger.addHandler(handler)
+            self.logger.addHandler(
+                _queue_handler if _queue_listener is not None else _stream_handler
+            )
+            _loggers.append(self.logger)
     
     def _format_message(self, level: str, message: str, **kwargs: Any) -> str:
         """Format log message as JSON.
@@ -55,14 +101,26 @@ class StructuredLogger:
         """
         self.logger.info(self._format_message("INFO", message, **kwargs))
     
-    def error(self, message: str, **kwargs: Any) -> None:
+    def error(
+        self,
+        message: str,
+        exc_info: Union[bool, BaseException] = False,
+        **kwargs: Any
+    ) -> None:
         """Log error message.
         
         Args:
             message: Log message
+            exc_info: Attach a traceback as a ``traceback`` JSON field: True
+                for the exception currently being handled, or an exception
+                instance to log after its except block has exited; it is only
+                formatted if the record is actually emitted
             **kwargs: Additional fields
         """
-        self.logger.error(self._format_message("ERROR", message, **kwargs))
+        self.logger.error(
+            self._format_message("ERROR", message, **kwargs),
+            exc_info=exc_info
+        )
     
     def warning(self, message: str, **kwargs: Any) -> None:
         """Log warning message.
@@ -83,6 +141,40 @@ class StructuredLogger:
         self.logger.debug(self._format_message("DEBUG", message, **kwargs))
 
 
+def start_queue_logging() -> None:
+    """Move log output off the calling thread.
+
+    Structured loggers enqueue records and a background listener writes them
+    to stdout.
+    """
+    global _queue_listener
+    
+    if _queue_listener is not None:
+        return
+    
+    _queue_listener = QueueListener(_log_queue, _stream_handler)
+    _queue_listener.start()
+    
+    for logger in _loggers:
+        logger.removeHandler(_stream_handler)
+        logger.addHandler(_queue_handler)
+
+
+def stop_queue_logging() -> None:
+    """Flush queued records and restore direct stdout logging."""
+    global _queue_listener
+    
+    if _queue_listener is None:
+        return
+    
+    for logger in _loggers:
+        logger.removeHandler(_queue_handler)
+        logger.addHandler(_stream_handler)
+    
+    _queue_listener.stop()
+    _queue_listener = None
+
+
 def get_logger(name: str) -> StructuredLogger:
     """Get a structured logger instance.
     
@@ -0,0 +1,27 @@
+"""Partial model types generated into ``prisma.partials``.
+
+Querying through a partial type's ``prisma()`` actions selects only its
+fields, so list reads can skip wide columns such as ``metadata``.
+"""
+from prisma.models import Job
+
+# Must match the fields of app.api.models.job.JobSummaryResponse
+Job.create_partial(
+    "JobSummary",
+    include=[
+        "id",
+        "userId",
+        "status",
+        "prompt",
+        "result",
+        "startedAt",
+        "completedAt",
+        "retryCount",
+        "usedProvider",
+        "usedModel",
+        "generationTimeMs",
+        "errorMessage",
+        "createdAt",
+        "updatedAt",
+    ]
+)
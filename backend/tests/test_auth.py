@@ -0,0 +1,117 @@
+"""Tests for JWT payload caching and login request validation."""
+import hashlib
+from datetime import timedelta
+
+import pytest
+from cachetools import TLRUCache
+from fastapi.security import HTTPAuthorizationCredentials
+
+from app.api import dependencies
+from app.api.models.auth import UserLogin, UserRegister
+from app.utils.auth import create_access_token, create_refresh_token
+
+
+def cache_key(token: str) -> str:
+    """Build the JWT cache key for a raw token."""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+@pytest.fixture
+def jwt_cache(monkeypatch):
+    """Give each test an empty JWT cache with a controllable clock."""
+    clock = {"now": 0.0}
+    cache = TLRUCache(
+        maxsize=100,
+        ttu=dependencies._jwt_cache.ttu,
+        timer=lambda: clock["now"]
+    )
+    monkeypatch.setattr(dependencies, "_jwt_cache", cache)
+    return cache, clock
+
+
+def test_valid_access_token_cached(jwt_cache, monkeypatch):
+    """A valid access token is decoded once and then served from the cache."""
+    cache, clock = jwt_cache
+    clock["now"] = dependencies.time.time()
+    token = create_access_token({"sub": "user-1"})
+
+    payload = dependencies._verify_cached(token)
+    assert payload["sub"] == "user-1"
+    assert cache_key(token) in cache
+
+    monkeypatch.setattr(dependencies, "decode_token", lambda _token: pytest.fail("decoded twice"))
+    assert dependencies._verify_cached(token) == payload
+
+
+def test_expired_token_not_cached(jwt_cache):
+    """An already expired access token is rejected and never cached."""
+    cache, _ = jwt_cache
+    token = create_access_token({"sub": "user-1"}, expires_delta=timedelta(seconds=-10))
+
+    assert dependencies._verify_cached(token) is None
+    assert cache_key(token) not in cache
+
+
+def test_invalid_token_not_cached(jwt_cache):
+    """Malformed or wrongly signed tokens are rejected and never cached."""
+    cache, _ = jwt_cache
+    forged = create_access_token({"sub": "user-1"})[:-4] + "AAAA"
+
+    for token in ("not-a-jwt", forged):
+        assert dependencies._verify_cached(token) is None
+        assert cache_key(token) not in cache
+
+
+def test_cached_token_not_served_after_exp(jwt_cache, monkeypatch):
+    """A cached payload expires at the token's own exp claim."""
+    cache, clock = jwt_cache
+    clock["now"] = dependencies.time.time()
+    token = create_access_token({"sub": "user-1"}, expires_delta=timedelta(minutes=5))
+    payload = dependencies._verify_cached(token)
+    assert cache_key(token) in cache
+
+    clock["now"] = payload["exp"] + 1
+    monkeypatch.setattr(dependencies, "decode_token", lambda _token: None)
+
+    assert cache_key(token) not in cache
+    assert dependencies._verify_cached(token) is None
+
+
+@pytest.mark.asyncio
+async def test_refresh_token_not_accepted_as_access_token(jwt_cache):
+    """Refresh tokens are never cached and never authenticate a request."""
+    cache, clock = jwt_cache
+    clock["now"] = dependencies.time.time()
+    token = create_refresh_token({"sub": "user-1"})
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+    payload = dependencies._verify_cached(token)
+    assert payload["type"] == "refresh"
+    assert cache_key(token) not in cache
+
+    # Rejected on the token type before the request is used to load the user
+    user, failure_detail = await dependencies._try_authenticate(None, credentials)
+    assert user is None
+    assert failure_detail == "Invalid token type"
+    assert cache_key(token) not in cache
+
+
+@pytest.mark.parametrize(
+    "email",
+    [
+        "user@example.com",
+        "User.Name@Example.COM",
+        "first+tag@Sub.Example.Org",
+        "MixedCase@EXAMPLE.io",
+    ]
+)
+def test_login_email_normalized_like_register(email: str):
+    """Login normalizes emails exactly as registration does.
+
+    Args:
+        email: Email address as typed by the user
+    """
+    registered = UserRegister(email=email, password="password123")
+    login = UserLogin(email=email, password="password123")
+
+    assert login.email == registered.email
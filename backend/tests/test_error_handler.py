@@ -0,0 +1,56 @@
+"""Tests for the error handling middleware."""
+import io
+import json
+import logging
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+
+from app.api.middleware import error_handler
+from app.api.middleware.error_handler import ErrorHandlerMiddleware
+from app.utils.logger import _JSONRecordFormatter
+
+
+@pytest.fixture
+def log_output():
+    """Capture the middleware's log lines as JSON-formatted text.
+
+    Yields:
+        Buffer receiving one JSON object per line
+    """
+    buffer = io.StringIO()
+    handler = logging.StreamHandler(buffer)
+    handler.setFormatter(_JSONRecordFormatter())
+    error_handler.logger.logger.addHandler(handler)
+    yield buffer
+    error_handler.logger.logger.removeHandler(handler)
+
+
+@pytest.mark.asyncio
+async def test_unexpected_error_logs_traceback(log_output: io.StringIO):
+    """An unhandled route exception is logged with its traceback.
+
+    Args:
+        log_output: Captured log lines
+    """
+    app = FastAPI()
+    app.state.config = SimpleNamespace(APP_DEBUG=False)
+    app.add_middleware(ErrorHandlerMiddleware)
+
+    @app.get("/boom")
+    async def boom():
+        raise ZeroDivisionError("boom")
+
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        response = await client.get("/boom")
+
+    assert response.status_code == 500
+    assert response.json()["error"] == "Internal server error"
+
+    entries = [json.loads(line) for line in log_output.getvalue().splitlines()]
+    entry = next(e for e in entries if e["message"] == "Unexpected error")
+    assert entry["status_code"] == 500
+    assert "ZeroDivisionError: boom" in entry["traceback"]
+    assert "NoneType: None" not in entry["traceback"]
@@ -0,0 +1,121 @@
+"""Tests for the in-process healthy provider cache."""
+import asyncio
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+import pytest
+
+from app.monitoring import health_cache
+
+
+class FakeProviderHealth:
+    """Stands in for ``db.providerhealth``, returning queued results."""
+
+    def __init__(self, *results: List[str]):
+        self.results = list(results)
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def find_many(self, **kwargs: Any) -> List[str]:
+        self.calls += 1
+        result = self.results.pop(0)
+        await self.release.wait()
+        return result
+
+
+def make_db(*results: List[str]) -> SimpleNamespace:
+    """Build a fake Prisma client whose provider lookups return results in order."""
+    return SimpleNamespace(providerhealth=FakeProviderHealth(*results))
+
+
+@pytest.fixture
+def clock(monkeypatch) -> Dict[str, float]:
+    """Reset the cache and drive its clock manually.
+
+    Only the module's own ``time`` reference is replaced, so the event loop
+    keeps using the real monotonic clock.
+    """
+    now = {"value": 1000.0}
+    monkeypatch.setattr(health_cache, "time", SimpleNamespace(monotonic=lambda: now["value"]))
+    monkeypatch.setattr(health_cache, "_cache", None)
+    monkeypatch.setattr(health_cache, "_version", 0)
+    monkeypatch.setattr(health_cache, "_refreshing", False)
+    monkeypatch.setattr(health_cache, "_refresh_task", None)
+    return now
+
+
+@pytest.mark.asyncio
+async def test_fresh_entry_served_from_cache(clock):
+    """A list younger than the TTL is served without a database read."""
+    db = make_db(["a"], ["b"])
+
+    assert await health_cache.get_healthy_providers_cached(db, ttl=5, max_stale=60) == ["a"]
+    clock["value"] += 4
+    assert await health_cache.get_healthy_providers_cached(db, ttl=5, max_stale=60) == ["a"]
+
+    assert db.providerhealth.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_served_while_refreshing(clock):
+    """A stale list is returned at once and refreshed exactly once in the background."""
+    db = make_db(["a"], ["b"])
+    await health_cache.get_healthy_providers_cached(db, ttl=5, max_stale=60)
+    clock["value"] += 10
+
+    assert await health_cache.get_healthy_providers_cached(db, ttl=5, max_stale=60) == ["a"]
+    assert await health_cache.get_healthy_providers_cached(db, ttl=5, max_stale=60) == ["a"]
+
+    await health_cache._refresh_task
+
+    assert db.providerhealth.calls == 2
+    assert await health_cache.get_healthy_providers_cached(db, ttl=5, max_stale=60) == ["b"]
+    assert health_cache._refreshing is False
+
+
+@pytest.mark.asyncio
+async def test_expired_entry_reloaded_synchronously(clock):
+    """A list older than max_stale is never served."""
+    db = make_db(["a"], ["b"])
+    await health_cache.get_healthy_providers_cached(db, ttl=5, max_stale=60)
+    clock["value"] += 61
+
+    assert await health_cache.get_healthy_providers_cached(db, ttl=5, max_stale=60) == ["b"]
+    assert health_cache._refresh_task is None
+    assert db.providerhealth.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_invalidation_during_load_discards_result(clock):
+    """A list read before an invalidation is returned to its caller but not cached."""
+    db = make_db(["old"], ["new"])
+    db.providerhealth.release.clear()
+
+    pending = asyncio.ensure_future(health_cache.get_healthy_providers_cached(db))
+    await asyncio.sleep(0)
+    health_cache.invalidate_healthy_providers()
+    db.providerhealth.release.set()
+
+    assert await pending == ["old"]
+    assert health_cache._cache is None
+    assert await health_cache.get_healthy_providers_cached(db) == ["new"]
+    assert db.providerhealth.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_invalidation_during_background_refresh(clock):
+    """A background refresh racing an invalidation does not restore stale data."""
+    db = make_db(["a"], ["stale"], ["fresh"])
+    await health_cache.get_healthy_providers_cached(db, ttl=5, max_stale=60)
+    clock["value"] += 10
+    db.providerhealth.release.clear()
+
+    assert await health_cache.get_healthy_providers_cached(db, ttl=5, max_stale=60) == ["a"]
+    await asyncio.sleep(0)
+    health_cache.invalidate_healthy_providers()
+    db.providerhealth.release.set()
+    await health_cache._refresh_task
+
+    assert health_cache._cache is None
+    assert await health_cache.get_healthy_providers_cached(db, ttl=5, max_stale=60) == ["fresh"]
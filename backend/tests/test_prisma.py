@@ -0,0 +1,70 @@
+"""Tests for Prisma datasource URL construction."""
+from urllib.parse import parse_qsl, urlsplit
+
+import pytest
+
+from app.db import prisma as prisma_module
+
+
+def query_params(url: str) -> dict:
+    """Parse a URL's query string into a dict."""
+    return dict(parse_qsl(urlsplit(url).query))
+
+
+@pytest.fixture
+def db_settings(monkeypatch):
+    """Pin the pool settings used to build the URL."""
+    monkeypatch.setattr(prisma_module.settings, "DATABASE_CONNECTION_LIMIT", 10)
+    monkeypatch.setattr(prisma_module.settings, "DATABASE_POOL_TIMEOUT", 20)
+    monkeypatch.setattr(prisma_module.settings, "DATABASE_PGBOUNCER", False)
+    return monkeypatch
+
+
+def test_pool_defaults_added(db_settings):
+    """Configured pool parameters are added to a URL without any."""
+    db_settings.setattr(prisma_module.settings, "DATABASE_URL", "postgresql://u:p@db:5432/app")
+
+    url = prisma_module.get_datasource_url()
+
+    assert url.startswith("postgresql://u:p@db:5432/app?")
+    assert query_params(url) == {"connection_limit": "10", "pool_timeout": "20"}
+
+
+def test_existing_params_preserved(db_settings):
+    """Explicit pool parameters and unrelated options in DATABASE_URL win."""
+    db_settings.setattr(
+        prisma_module.settings,
+        "DATABASE_URL",
+        "postgresql://u:p@db:5432/app?connection_limit=3&pool_timeout=7&sslmode=require"
+    )
+
+    params = query_params(prisma_module.get_datasource_url())
+
+    assert params == {"connection_limit": "3", "pool_timeout": "7", "sslmode": "require"}
+
+
+def test_pgbouncer_flag_added(db_settings):
+    """DATABASE_PGBOUNCER adds pgbouncer=true."""
+    db_settings.setattr(prisma_module.settings, "DATABASE_URL", "postgresql://u:p@db:6432/app")
+    db_settings.setattr(prisma_module.settings, "DATABASE_PGBOUNCER", True)
+
+    assert query_params(prisma_module.get_datasource_url())["pgbouncer"] == "true"
+
+
+def test_existing_pgbouncer_param_preserved(db_settings):
+    """A pgbouncer value already in DATABASE_URL is not overridden."""
+    db_settings.setattr(
+        prisma_module.settings,
+        "DATABASE_URL",
+        "postgresql://u:p@db:6432/app?pgbouncer=false"
+    )
+    db_settings.setattr(prisma_module.settings, "DATABASE_PGBOUNCER", True)
+
+    assert query_params(prisma_module.get_datasource_url())["pgbouncer"] == "false"
+
+
+def test_pgbouncer_not_added_by_default(db_settings):
+    """Without DATABASE_PGBOUNCER no pgbouncer parameter is set."""
+    db_settings.setattr(prisma_module.settings, "DATABASE_URL", "postgresql://u:p@db:5432/app")
+
+    assert "pgbouncer" not in query_params(prisma_module.get_datasource_url())
@@ -3,7 +3,7 @@
 import { useEffect, useState } from 'react';
 import { useRouter } from 'next/navigation';
 import { useAuth } from '@/app/providers/auth-provider';
-import { jobsApi, Job } from '@/services/api';
+import { jobsApi, JobSummary } from '@/services/api';
 import JobCard from '@/components/JobCard';
 import { RefreshCcw, Plus } from 'lucide-react';
 import Link from 'next/link';
@@ -11,7 +11,7 @@ import Link from 'next/link';
 export default function JobsPage() {
   const router = useRouter();
   const { isAuthenticated, loading: authLoading } = useAuth();
-  const [jobs, setJobs] = useState<Job[]>([]);
+  const [jobs, setJobs] = useState<JobSummary[]>([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
 
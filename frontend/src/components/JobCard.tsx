@@ -1,7 +1,7 @@
 'use client';
 
 import { useState } from 'react';
-import { Job } from '@/services/api';
+import { JobSummary } from '@/services/api';
 import { Calendar, Clock, Film, AlertCircle, CheckCircle, Loader2, XCircle, RefreshCw, X } from 'lucide-react';
 import { clsx, type ClassValue } from 'clsx';
 import { twMerge } from 'tailwind-merge';
@@ -12,7 +12,7 @@ function cn(...inputs: ClassValue[]) {
 }
 
 interface JobCardProps {
-  job: Job;
+  job: JobSummary;
   onUpdate?: () => void;
 }
 
@@ -141,6 +141,9 @@ export interface Job {
   updatedAt: string;
 }
 
+// Jobs as returned by the list endpoint
+export type JobSummary = Omit<Job, 'metadata' | 'maxRetries' | 'celeryTaskId'>;
+
 export interface Project {
   id: string;
   userId: string;
@@ -151,17 +154,19 @@ export interface Project {
 }
 
 export interface JobListResponse {
-  jobs: Job[];
-  total: number;
+  jobs: JobSummary[];
+  total: number | null;
   skip: number;
   take: number;
+  nextCursor: string | null;
 }
 
 export interface ProjectListResponse {
   projects: Project[];
-  total: number;
+  total: number | null;
   skip: number;
   take: number;
+  nextCursor: string | null;
 }
 
 export interface JobStatsResponse {